@@ -18,82 +18,103 @@ All anomaly detection is based on deterministic rules and logical analysis,
 ensuring reproducible and defensible forensic findings.
 """
 
+import bisect
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from collections import defaultdict, Counter
 
+try:
+    # orjson parses and serializes large evidence files several times
+    # faster than stdlib json
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _load_one(file_path, label):
+    """Load a single evidence JSON file, returning [] on any failure."""
+    try:
+        with open(file_path, 'rb') as f:
+            records = _loads(f.read())
+        print(f"Loaded {len(records)} {label} records")
+        return records
+    except Exception as e:
+        print(f"Error loading {label} evidence: {e}")
+        return []
+
+
+# Evidence source -> file name mapping used by load_processed_evidence
+_FILES = {
+    "SMS": "sms.json",
+    "CALL": "calls.json",
+    "MEDIA": "media.json",
+    "APP": "apps.json"
+}
+
+
+def _parse_iso(s):
+    """Parse the fixed "YYYY-MM-DD HH:MM:SS" evidence timestamp shape.
+
+    Evidence timestamps are always written by our own extractors in this
+    exact 19-character form, so slicing straight into the datetime
+    constructor skips all format interpretation (faster than both
+    strptime and fromisoformat). Raises ValueError on malformed input.
+    """
+    if len(s) != 19:
+        raise ValueError(f"unexpected timestamp shape: {s!r}")
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
 
 def load_processed_evidence(processed_dir):
     """
     Load processed evidence for anomaly analysis.
-    
-    TODO: Implement proper JSON file loading with validation
+
+    The four evidence files are read concurrently with a small thread
+    pool: file reads release the GIL, so cold-disk I/O for sms/calls/
+    media/apps overlaps instead of being serialized on one thread.
+
     TODO: Add evidence timestamp normalization
     TODO: Handle missing or corrupted evidence files
-    
+
     Args:
         processed_dir: Path to processed evidence directory
-        
+
     Returns:
         dict: Processed evidence data with timestamps
     """
-    evidence_data = {
-        "SMS": [],
-        "CALL": [],
-        "MEDIA": [],
-        "APP": []
-    }
-    
-    # TODO: Load actual evidence files from processed directory
-    # Placeholder: Check if processed directory exists
-    if os.path.exists(processed_dir):
-        print(f"Loading evidence for anomaly analysis: {processed_dir}")
-        
-        # Load SMS evidence
-        sms_file = os.path.join(processed_dir, "sms.json")
-        if os.path.exists(sms_file):
-            try:
-                with open(sms_file, 'r') as f:
-                    evidence_data["SMS"] = json.load(f)
-                print(f"Loaded {len(evidence_data['SMS'])} SMS records")
-            except Exception as e:
-                print(f"Error loading SMS evidence: {e}")
-        
-        # Load CALL evidence
-        calls_file = os.path.join(processed_dir, "calls.json")
-        if os.path.exists(calls_file):
-            try:
-                with open(calls_file, 'r') as f:
-                    evidence_data["CALL"] = json.load(f)
-                print(f"Loaded {len(evidence_data['CALL'])} call records")
-            except Exception as e:
-                print(f"Error loading call evidence: {e}")
-        
-        # Load MEDIA evidence
-        media_file = os.path.join(processed_dir, "media.json")
-        if os.path.exists(media_file):
-            try:
-                with open(media_file, 'r') as f:
-                    evidence_data["MEDIA"] = json.load(f)
-                print(f"Loaded {len(evidence_data['MEDIA'])} media records")
-            except Exception as e:
-                print(f"Error loading media evidence: {e}")
-        
-        # Load APP evidence
-        apps_file = os.path.join(processed_dir, "apps.json")
-        if os.path.exists(apps_file):
-            try:
-                with open(apps_file, 'r') as f:
-                    evidence_data["APP"] = json.load(f)
-                print(f"Loaded {len(evidence_data['APP'])} app records")
-            except Exception as e:
-                print(f"Error loading app evidence: {e}")
-        
-    else:
+    if not os.path.exists(processed_dir):
         print(f"Processed evidence directory not found: {processed_dir}")
-    
+        return {source: [] for source in _FILES}
+
+    print(f"Loading evidence for anomaly analysis: {processed_dir}")
+
+    # One scandir enumerates the directory in a single syscall instead of
+    # a stat per candidate file — cheaper, especially on network mounts.
+    present = {entry.name for entry in os.scandir(processed_dir)}
+
+    evidence_data = {source: [] for source in _FILES}
+
+    with ThreadPoolExecutor(max_workers=len(_FILES)) as executor:
+        futures = {
+            source: executor.submit(_load_one, os.path.join(processed_dir, file_name), source)
+            for source, file_name in _FILES.items()
+            if file_name in present
+        }
+        for source, future in futures.items():
+            evidence_data[source] = future.result()
+
     return evidence_data
 
 
@@ -113,7 +134,8 @@ def normalize_timestamps(evidence_data):
         evidence_data (dict): Raw evidence data
         
     Returns:
-        dict: Evidence with normalized timestamps
+        dict: Evidence with normalized timestamps, each source sorted
+        chronologically (downstream detectors rely on this ordering)
     """
     normalized_data = {}
     
@@ -122,13 +144,18 @@ def normalize_timestamps(evidence_data):
         
         for evidence in evidence_list:
             try:
-                # Parse timestamp to validate format
+                # Parse timestamp to validate format (specialized for the
+                # fixed shape our extractors emit).
                 timestamp_str = evidence["timestamp"]
-                parsed_timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+                parsed_timestamp = _parse_iso(timestamp_str)
                 
                 # Add parsed timestamp for easier analysis
                 normalized_item = evidence.copy()
                 normalized_item["parsed_timestamp"] = parsed_timestamp
+                # Epoch seconds as a plain int: downstream comparisons and
+                # differences become single int ops instead of datetime
+                # rich-comparison and timedelta allocation.
+                normalized_item["_ts_epoch"] = int(parsed_timestamp.timestamp())
                 normalized_item["timestamp_valid"] = True
                 
             except (ValueError, KeyError) as e:
@@ -137,227 +164,178 @@ def normalize_timestamps(evidence_data):
                 normalized_item = evidence.copy()
                 normalized_item["timestamp_valid"] = False
                 normalized_item["parsed_timestamp"] = None
+                normalized_item["_ts_epoch"] = None
             
             normalized_evidence.append(normalized_item)
-        
+
+        # Sort each source chronologically here, once. Downstream detectors
+        # rely on this ordering invariant instead of re-sorting per pass;
+        # invalid timestamps sort first.
+        normalized_evidence.sort(key=lambda x: x["parsed_timestamp"] or datetime.min)
         normalized_data[source_type] = normalized_evidence
     
     return normalized_data
 
 
-def detect_timestamp_gaps(evidence_data):
-    """
-    Detect unusual gaps in timestamp sequences.
-    
-    FORENSIC RULES:
-    - Large gaps (>24 hours) may indicate missing data
-    - Gaps during active periods are suspicious
-    - Consistent gap patterns may indicate systematic deletion
-    
-    TODO: Implement configurable gap thresholds
-    TODO: Add context-aware gap analysis
-    TODO: Implement gap pattern recognition
-    
-    Args:
-        evidence_data (dict): Evidence with normalized timestamps
-        
-    Returns:
-        list: Detected timestamp gap anomalies
-    """
-    anomalies = []
-    
-    for source_type, evidence_list in evidence_data.items():
-        # Filter evidence with valid timestamps
-        valid_evidence = [e for e in evidence_list if e.get("timestamp_valid", False)]
-        
-        if len(valid_evidence) < 2:
-            continue
-        
-        # Sort by timestamp
-        valid_evidence.sort(key=lambda x: x["parsed_timestamp"])
-        
-        # Check for gaps between consecutive events
-        for i in range(1, len(valid_evidence)):
-            prev_event = valid_evidence[i-1]
-            curr_event = valid_evidence[i]
-            
-            time_diff = curr_event["parsed_timestamp"] - prev_event["parsed_timestamp"]
-            
-            # TODO: Implement configurable gap threshold
-            GAP_THRESHOLD_HOURS = 24  # Placeholder threshold
-            
-            if time_diff.total_seconds() > GAP_THRESHOLD_HOURS * 3600:
-                anomaly = {
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "source": source_type,
-                    "type": "timestamp_gap",
-                    "details": f"Gap of {time_diff.days} days detected between {prev_event['timestamp']} and {curr_event['timestamp']}"
-                }
-                anomalies.append(anomaly)
-    
-    return anomalies
+# Mandatory fields every evidence record must carry
+REQUIRED_FIELDS = frozenset(("timestamp", "source", "type", "details"))
 
+# TODO: Implement configurable gap threshold
+GAP_THRESHOLD_HOURS = 24  # Placeholder threshold
 
-def detect_post_deletion_activity(evidence_data):
+
+def detect_all(evidence_data, analysis_ts):
     """
-    Detect events occurring after supposed deletion.
-    
-    FORENSIC RULES:
-    - Activity after deletion indicates potential data recovery
-    - May indicate evidence tampering or system inconsistency
-    - Critical for establishing timeline integrity
-    
-    TODO: Implement deletion event detection
-    TODO: Add activity correlation analysis
+    Run all anomaly detectors in a single fused pass per source.
+
+    FORENSIC RULES (unchanged from the previously separate detectors):
+    - timestamp_gap: large gaps (>24 hours) between consecutive valid events
+      may indicate missing or systematically deleted data
+    - post_deletion_activity: events after a deletion indicate potential
+      recovery, tampering, or system inconsistency
+    - future_timestamp: events dated after the analysis time
+    - missing_fields / duplicate_event: data integrity violations
+
+    The four rule families previously lived in separate detector functions
+    that each traversed every source list; fusing them into one scan over
+    the pre-sorted evidence removes three redundant traversals while
+    emitting exactly the same findings.
+
+    TODO: Add context-aware gap analysis
     TODO: Implement deletion verification
-    
+    TODO: Check for logical sequence violations
+
     Args:
-        evidence_data (dict): Evidence with normalized timestamps
-        
+        evidence_data (dict): Evidence with normalized timestamps, sorted
+        analysis_ts (str): Shared timestamp recorded on each anomaly
+
     Returns:
-        list: Detected post-deletion activity anomalies
+        list: Detected anomaly rows (timestamp, source, type, details)
     """
     anomalies = []
-    
-    for source_type, evidence_list in evidence_data.items():
-        # Sort by timestamp
-        evidence_list.sort(key=lambda x: x.get("parsed_timestamp", datetime.min))
-        
-        # Track deletion events
-        deletion_timestamps = []
-        
-        for evidence in evidence_list:
-            if evidence.get("type") == "deleted" and evidence.get("timestamp_valid"):
-                deletion_timestamps.append(evidence["parsed_timestamp"])
-        
-        # Check for activity after each deletion
-        for deletion_time in deletion_timestamps:
-            post_deletion_activity = []
-            
-            for evidence in evidence_list:
-                if (evidence.get("timestamp_valid") and 
-                    evidence["parsed_timestamp"] > deletion_time and
-                    evidence.get("type") != "deleted"):
-                    post_deletion_activity.append(evidence)
-            
-            if post_deletion_activity:
-                anomaly = {
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "source": source_type,
-                    "type": "post_deletion_activity",
-                    "details": f"{len(post_deletion_activity)} events detected after deletion at {deletion_time.strftime('%Y-%m-%d %H:%M:%S')}"
-                }
-                anomalies.append(anomaly)
-    
-    return anomalies
 
+    now_epoch = int(datetime.now().timestamp())
+    threshold_seconds = GAP_THRESHOLD_HOURS * 3600
 
-def detect_temporal_inconsistencies(evidence_data):
-    """
-    Detect temporal and logical inconsistencies.
-    
-    FORENSIC RULES:
-    - Events with timestamps in the future (relative to last known activity)
-    - Inconsistent sequences (e.g., response before request)
-    - Overlapping events that shouldn't overlap
-    - Timestamps outside device operational period
-    
-    TODO: Implement device-specific timeline validation
-    TODO: Add logical sequence verification
-    TODO: Implement overlapping event detection
-    
-    Args:
-        evidence_data (dict): Evidence with normalized timestamps
-        
-    Returns:
-        list: Detected temporal inconsistency anomalies
-    """
-    anomalies = []
-    
-    # Get current time for future timestamp detection
-    current_time = datetime.now()
-    
     for source_type, evidence_list in evidence_data.items():
-        valid_evidence = [e for e in evidence_list if e.get("timestamp_valid", False)]
-        
-        for evidence in valid_evidence:
-            event_time = evidence["parsed_timestamp"]
-            
-            # Check for future timestamps
-            if event_time > current_time:
-                anomaly = {
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "source": source_type,
-                    "type": "future_timestamp",
-                    "details": f"Event timestamp {evidence['timestamp']} is in the future"
-                }
-                anomalies.append(anomaly)
-            
-            # TODO: Implement more temporal consistency checks
-            # TODO: Check for logical sequence violations
-            # TODO: Detect overlapping incompatible events
-    
-    return anomalies
+        n = len(evidence_list)
 
+        # Post-deletion bookkeeping only when deletions exist at all —
+        # the common case of zero deletions skips the suffix setup.
+        has_deletions = any(e.get("type") == "deleted" and e.get("timestamp_valid")
+                            for e in evidence_list)
+
+        if has_deletions:
+            # Suffix counts of valid non-deleted events make the "activity
+            # after this deletion?" question O(1) per deletion; bisect over
+            # the sorted epochs finds the first strictly later event.
+            suffix = [0] * (n + 1)
+
+            for i in range(n - 1, -1, -1):
+                evidence = evidence_list[i]
+                is_nondel = (evidence.get("timestamp_valid") and
+                             evidence.get("type") != "deleted")
+                suffix[i] = suffix[i + 1] + (1 if is_nondel else 0)
+
+            sorted_epochs = [e["_ts_epoch"] if e["_ts_epoch"] is not None else -(1 << 62)
+                             for e in evidence_list]
+
+        # Count duplicate tuple signatures in one C-level Counter pass
+        event_signatures = Counter(
+            (e.get("timestamp", ""), e.get("type", ""), e.get("details", ""))
+            for e in evidence_list
+        )
+
+        prev_epoch = None
+        prev_ts_str = None
 
-def detect_data_inconsistencies(evidence_data):
-    """
-    Detect data integrity and consistency anomalies.
-    
-    FORENSIC RULES:
-    - Duplicate events with identical timestamps
-    - Missing mandatory fields in evidence
-    - Inconsistent data formats
-    - Logical contradictions in evidence
-    
-    TODO: Implement data format validation
-    TODO: Add duplicate detection with tolerance
-    TODO: Implement logical consistency checks
-    
-    Args:
-        evidence_data (dict): Evidence data
-        
-    Returns:
-        list: Detected data inconsistency anomalies
-    """
-    anomalies = []
-    
-    for source_type, evidence_list in evidence_data.items():
-        # Check for duplicate events
-        event_signatures = Counter()
-        
         for evidence in evidence_list:
-            # Create event signature for duplicate detection
-            signature = f"{evidence.get('timestamp', '')}_{evidence.get('type', '')}_{evidence.get('details', '')}"
-            event_signatures[signature] += 1
-            
-            # Check for missing mandatory fields
-            required_fields = ["timestamp", "source", "type", "details"]
-            missing_fields = [field for field in required_fields if field not in evidence]
-            
+            # Check for missing mandatory fields (C-level set difference)
+            missing_fields = REQUIRED_FIELDS.difference(evidence)
+
             if missing_fields:
-                anomaly = {
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "source": source_type,
-                    "type": "missing_fields",
-                    "details": f"Missing required fields: {missing_fields} in event {evidence.get('timestamp', 'unknown')}"
-                }
-                anomalies.append(anomaly)
-        
-        # Report duplicates
+                anomalies.append((
+                    analysis_ts,
+                    source_type,
+                    "missing_fields",
+                    f"Missing required fields: {sorted(missing_fields)} in event {evidence.get('timestamp', 'unknown')}"
+                ))
+
+            if not evidence.get("timestamp_valid"):
+                continue
+
+            epoch = evidence["_ts_epoch"]
+
+            # Check for future timestamps
+            if epoch > now_epoch:
+                anomalies.append((
+                    analysis_ts,
+                    source_type,
+                    "future_timestamp",
+                    f"Event timestamp {evidence['timestamp']} is in the future"
+                ))
+
+            # Check the gap against the previous valid event
+            if prev_epoch is not None:
+                gap_seconds = epoch - prev_epoch
+
+                if gap_seconds > threshold_seconds:
+                    anomalies.append((
+                        analysis_ts,
+                        source_type,
+                        "timestamp_gap",
+                        f"Gap of {gap_seconds // 86400} days detected between {prev_ts_str} and {evidence['timestamp']}"
+                    ))
+
+            prev_epoch = epoch
+            prev_ts_str = evidence["timestamp"]
+
+            # Check for activity after this deletion
+            if has_deletions and evidence.get("type") == "deleted":
+                post_deletion_count = suffix[bisect.bisect_right(sorted_epochs, epoch)]
+
+                if post_deletion_count:
+                    anomalies.append((
+                        analysis_ts,
+                        source_type,
+                        "post_deletion_activity",
+                        f"{post_deletion_count} events detected after deletion at {evidence['parsed_timestamp'].strftime('%Y-%m-%d %H:%M:%S')}"
+                    ))
+
+        # Report duplicates (only format the signature when actually emitting)
         for signature, count in event_signatures.items():
             if count > 1:
-                anomaly = {
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "source": source_type,
-                    "type": "duplicate_event",
-                    "details": f"Duplicate event detected {count} times: {signature[:50]}..."
-                }
-                anomalies.append(anomaly)
-    
+                signature_str = "_".join(signature)
+                anomalies.append((
+                    analysis_ts,
+                    source_type,
+                    "duplicate_event",
+                    f"Duplicate event detected {count} times: {signature_str[:50]}..."
+                ))
+
     return anomalies
 
 
+def _to_dicts(rows):
+    """Expand anomaly row tuples into the report's dict schema."""
+    return [
+        {"timestamp": r[0], "source": r[1], "type": r[2], "details": r[3]}
+        for r in rows
+    ]
+
+
+# Severity classification: anomaly type -> index into _SEVERITY_LABELS.
+# Unknown types default to LOW (index 3).
+_SEVERITY_LABELS = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+_SEVERITY_IDX = {
+    "future_timestamp": 0,
+    "post_deletion_activity": 1,
+    "timestamp_gap": 2,
+    "missing_fields": 2,
+    "duplicate_event": 3
+}
+
+
 def calculate_anomaly_severity(anomalies):
     """
     Calculate severity scores for detected anomalies.
@@ -376,28 +354,16 @@ def calculate_anomaly_severity(anomalies):
     Returns:
         dict: Severity assessment results
     """
-    severity_scores = {
-        "CRITICAL": 0,
-        "HIGH": 0,
-        "MEDIUM": 0,
-        "LOW": 0
-    }
-    
     # TODO: Implement proper severity weighting
-    # Placeholder: Simple severity classification
-    severity_weights = {
-        "future_timestamp": "CRITICAL",
-        "post_deletion_activity": "HIGH",
-        "timestamp_gap": "MEDIUM",
-        "duplicate_event": "LOW",
-        "missing_fields": "MEDIUM"
-    }
-    
-    for anomaly in anomalies:
-        anomaly_type = anomaly.get("type", "unknown")
-        severity = severity_weights.get(anomaly_type, "LOW")
-        severity_scores[severity] += 1
-    
+    # Counting into a small int-indexed list avoids a string dict lookup
+    # and hash per anomaly; labels are attached once at the end.
+    counts = [0, 0, 0, 0]
+
+    for row in anomalies:
+        counts[_SEVERITY_IDX.get(row[2], 3)] += 1
+
+    severity_scores = dict(zip(_SEVERITY_LABELS, counts))
+
     return {
         "severity_distribution": severity_scores,
         "total_anomalies": len(anomalies),
@@ -421,21 +387,18 @@ def generate_anomaly_report(anomalies, severity_assessment):
     Returns:
         dict: Anomaly analysis report
     """
+    # Categorize anomalies in two C-level Counter passes instead of two
+    # dict increments per anomaly in Python.
     report = {
         "analysis_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "analysis_type": "anomaly_analysis",
         "severity_assessment": severity_assessment,
         "total_anomalies": len(anomalies),
-        "anomalies_by_type": defaultdict(int),
-        "anomalies_by_source": defaultdict(int),
-        "findings": anomalies
+        "anomalies_by_type": Counter(row[2] for row in anomalies),
+        "anomalies_by_source": Counter(row[1] for row in anomalies),
+        "findings": _to_dicts(anomalies)
     }
-    
-    # Categorize anomalies
-    for anomaly in anomalies:
-        report["anomalies_by_type"][anomaly["type"]] += 1
-        report["anomalies_by_source"][anomaly["source"]] += 1
-    
+
     return report
 
 
@@ -452,8 +415,10 @@ def save_anomaly_report(report, output_file):
         output_file (Path): Output file path
     """
     try:
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Serialize to bytes first, then write in a single call — avoids
+        # stdlib json.dump's incremental str chunks and re-encoding.
+        with open(output_file, 'wb') as f:
+            f.write(_dumps_indented(report))
         print(f"Anomaly analysis report saved to: {output_file}")
     except Exception as e:
         print(f"Error saving anomaly report: {e}")
@@ -479,29 +444,30 @@ def main():
     
     # Load processed evidence
     evidence_data = load_processed_evidence(processed_dir)
-    
+
+    output_dir = os.path.join(base_path, "cases", "case_002", "analysis")
+    output_file = os.path.join(output_dir, "anomaly_analysis_report.json")
+
+    # Nothing to analyze: write an empty report and skip normalization and
+    # detection entirely (frequent no-op pipeline runs stay cheap).
+    if not any(evidence_data.values()):
+        print("No evidence loaded - writing empty anomaly report")
+        empty_severity = calculate_anomaly_severity([])
+        save_anomaly_report(generate_anomaly_report([], empty_severity), output_file)
+        return
+
     # Normalize timestamps
     print("\nNormalizing timestamps...")
     normalized_data = normalize_timestamps(evidence_data)
-    
-    all_anomalies = []
-    
-    # Detect different types of anomalies
-    print("Detecting timestamp gaps...")
-    gap_anomalies = detect_timestamp_gaps(normalized_data)
-    all_anomalies.extend(gap_anomalies)
-    
-    print("Detecting post-deletion activity...")
-    deletion_anomalies = detect_post_deletion_activity(normalized_data)
-    all_anomalies.extend(deletion_anomalies)
-    
-    print("Detecting temporal inconsistencies...")
-    temporal_anomalies = detect_temporal_inconsistencies(normalized_data)
-    all_anomalies.extend(temporal_anomalies)
-    
-    print("Detecting data inconsistencies...")
-    data_anomalies = detect_data_inconsistencies(normalized_data)
-    all_anomalies.extend(data_anomalies)
+
+    # One analysis timestamp shared by every detector: avoids a clock read
+    # plus strftime per emitted anomaly and keeps the report deterministic.
+    analysis_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # All detectors run in one fused pass over the sorted evidence
+    print("Detecting anomalies (fused single pass)...")
+    all_anomalies = detect_all(normalized_data, analysis_ts)
+    type_counts = Counter(row[2] for row in all_anomalies)
     
     # Calculate severity assessment
     severity_assessment = calculate_anomaly_severity(all_anomalies)
@@ -510,19 +476,16 @@ def main():
     anomaly_report = generate_anomaly_report(all_anomalies, severity_assessment)
     
     # Save report
-    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    output_dir = os.path.join(base_path, "cases", "case_002", "analysis")
-    output_file = os.path.join(output_dir, "anomaly_analysis_report.json")
     save_anomaly_report(anomaly_report, output_file)
     
     print(f"\nAnomaly Analysis Summary:")
     print(f"  Total anomalies: {len(all_anomalies)}")
     print(f"  Critical: {severity_assessment['critical_anomalies']}")
     print(f"  High: {severity_assessment['high_anomalies']}")
-    print(f"  Timestamp gaps: {len(gap_anomalies)}")
-    print(f"  Post-deletion activity: {len(deletion_anomalies)}")
-    print(f"  Temporal inconsistencies: {len(temporal_anomalies)}")
-    print(f"  Data inconsistencies: {len(data_anomalies)}")
+    print(f"  Timestamp gaps: {type_counts['timestamp_gap']}")
+    print(f"  Post-deletion activity: {type_counts['post_deletion_activity']}")
+    print(f"  Temporal inconsistencies: {type_counts['future_timestamp']}")
+    print(f"  Data inconsistencies: {type_counts['missing_fields'] + type_counts['duplicate_event']}")
     print(f"  Report saved to: {output_file}")
 
 
@@ -7,7 +7,7 @@ Detects temporal and logical inconsistencies in call data.
 """
 
 import json
-from datetime import datetime, time
+from datetime import datetime
 from pathlib import Path
 
 
@@ -18,6 +18,7 @@ PROCESSED_DIR = Path(__file__).parent.parent / "evidence" / "processed"
 OUTPUT_FILE = Path(__file__).parent.parent / "analysis" / "anomaly_call_analysis_report.json"
 
 TIME_GAP_HOURS = 24
+UNUSUAL_HOUR_END = 4 * 3600  # 00:00:00-04:00:00 inclusive, in seconds of day
 
 
 # -------------------------------
@@ -46,40 +47,40 @@ def detect_call_anomalies(calls):
     if len(calls) < 2:
         return findings
 
-    # Sort calls by timestamp
-    calls_sorted = sorted(
-        calls,
-        key=lambda x: datetime.strptime(x["timestamp"], "%Y-%m-%d %H:%M:%S")
-    )
+    # Parse every timestamp exactly once (fromisoformat is a C-level parse,
+    # far cheaper than repeated strptime calls) and sort indices instead of
+    # re-parsing inside the sort key.
+    parsed = [datetime.fromisoformat(c["timestamp"]) for c in calls]
+    order = sorted(range(len(calls)), key=parsed.__getitem__)
 
-    # Rule 1: Large time gaps
-    for i in range(1, len(calls_sorted)):
-        t1 = datetime.strptime(
-            calls_sorted[i - 1]["timestamp"], "%Y-%m-%d %H:%M:%S"
-        )
-        t2 = datetime.strptime(
-            calls_sorted[i]["timestamp"], "%Y-%m-%d %H:%M:%S"
-        )
+    # Both rules in one pass over the sorted calls. The unusual-hour check
+    # is a single int comparison on seconds-of-day instead of constructing
+    # and rich-comparing time objects per call.
+    prev = None
 
-        gap_hours = (t2 - t1).total_seconds() / 3600
+    for curr in order:
+        call_dt = parsed[curr]
 
-        if gap_hours >= TIME_GAP_HOURS:
-            findings.append({
-                "timestamp": calls_sorted[i]["timestamp"],
-                "source": "CALL",
-                "type": "temporal_gap",
-                "details": f"Unusual time gap of {int(gap_hours)} hours between calls"
-            })
+        # Rule 1: Large time gaps
+        if prev is not None:
+            gap_hours = (call_dt - parsed[prev]).total_seconds() / 3600
+
+            if gap_hours >= TIME_GAP_HOURS:
+                findings.append({
+                    "timestamp": calls[curr]["timestamp"],
+                    "source": "CALL",
+                    "type": "temporal_gap",
+                    "details": f"Unusual time gap of {int(gap_hours)} hours between calls"
+                })
+
+        prev = curr
 
-    # Rule 2: Calls during unusual hours
-    for call in calls:
-        call_time = datetime.strptime(
-            call["timestamp"], "%Y-%m-%d %H:%M:%S"
-        ).time()
+        # Rule 2: Calls during unusual hours (00:00-04:00 inclusive)
+        second_of_day = call_dt.hour * 3600 + call_dt.minute * 60 + call_dt.second
 
-        if time(0, 0) <= call_time <= time(4, 0):
+        if second_of_day <= UNUSUAL_HOUR_END:
             findings.append({
-                "timestamp": call["timestamp"],
+                "timestamp": calls[curr]["timestamp"],
                 "source": "CALL",
                 "type": "unusual_hour",
                 "details": "Call activity detected during unusual hours (00:00–04:00)"
@@ -18,9 +18,116 @@ ensuring explainable and court-defensible results.
 
 import json
 import os
-from datetime import datetime, time
+import re
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import Counter
+
+try:
+    # orjson serializes reports several times faster than stdlib json
+    # and emits bytes directly
+    import orjson
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+try:
+    # ijson parses JSON incrementally, so large evidence arrays never sit
+    # in memory twice (raw bytes + parsed list) during loading
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _load_json_array(path):
+    """Load a JSON evidence array, streaming record-by-record if ijson
+    is installed and falling back to a plain json.load otherwise."""
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            return list(ijson.items(f, 'item'))
+        return json.load(f)
+
+
+def _iter_records(path):
+    """Yield evidence records from a JSON array file one at a time.
+
+    With ijson installed the file is parsed incrementally, so analyzers
+    consuming this generator never materialize the full evidence list.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    else:
+        yield from _load_json_array(path)
+
+
+# Unusual-hour windows as inclusive (start, end) seconds-of-day bounds
+LATE_NIGHT_CALL_WINDOW = (2 * 3600, 5 * 3600)  # 02:00:00 - 05:00:00
+LATE_NIGHT_SMS_WINDOW = (1 * 3600, 4 * 3600)   # 01:00:00 - 04:00:00
+UNUSUAL_APP_WINDOW = (3 * 3600, 5 * 3600)      # 03:00:00 - 05:00:00
+
+
+@lru_cache(maxsize=65536)
+def _seconds_of_day(ts):
+    """
+    Return seconds since midnight for a "YYYY-MM-DD HH:MM:SS" string.
+
+    Evidence timestamps always use this fixed shape, so slicing the time
+    fields out directly skips strptime's per-call format interpretation
+    and the time-object allocation per record; the window checks become
+    plain int comparisons. Bursty call/SMS logs repeat second-granularity
+    timestamps heavily, so results are memoized. Raises ValueError on
+    malformed input.
+    """
+    return int(ts[11:13]) * 3600 + int(ts[14:16]) * 60 + int(ts[17:19])
+
+
+def _count_in_window(evidence, window):
+    """
+    Count records whose time-of-day falls inside the inclusive window.
+
+    Shared hot loop of the three analyzers: one tight pass of int
+    compares per source with no per-record allocations.
+
+    Args:
+        evidence (list): Evidence entries with "timestamp" fields
+        window (tuple): Inclusive (start, end) seconds-of-day bounds
+
+    Returns:
+        int: Number of records inside the window
+    """
+    lo, hi = window
+    count = 0
+
+    for entry in evidence:
+        try:
+            if lo <= _seconds_of_day(entry["timestamp"]) <= hi:
+                count += 1
+        except ValueError:
+            print(f"Invalid timestamp format: {entry['timestamp']}")
+
+    return count
+
+
+# Compiled once: phone numbers as they appear in extractor details
+# strings (optional +, 7-15 digits)
+_PHONE_RE = re.compile(r"\+?\d{7,15}")
+
+
+def _contact_of(entry):
+    """
+    Extract the contact/number an evidence entry refers to.
+
+    Numbers are pulled from the details string with a module-level
+    compiled regex; entries without a recognizable number fall back to
+    "unknown" so counting still works on partial evidence.
+    """
+    match = _PHONE_RE.search(entry.get("details", ""))
+    return match.group(0) if match else "unknown"
 
 
 def load_processed_evidence(processed_dir):
@@ -53,8 +160,7 @@ def load_processed_evidence(processed_dir):
         sms_file = os.path.join(processed_dir, "sms.json")
         if os.path.exists(sms_file):
             try:
-                with open(sms_file, 'r') as f:
-                    evidence_data["SMS"] = json.load(f)
+                evidence_data["SMS"] = _load_json_array(sms_file)
                 print(f"Loaded {len(evidence_data['SMS'])} SMS records")
             except Exception as e:
                 print(f"Error loading SMS evidence: {e}")
@@ -63,8 +169,7 @@ def load_processed_evidence(processed_dir):
         calls_file = os.path.join(processed_dir, "calls.json")
         if os.path.exists(calls_file):
             try:
-                with open(calls_file, 'r') as f:
-                    evidence_data["CALL"] = json.load(f)
+                evidence_data["CALL"] = _load_json_array(calls_file)
                 print(f"Loaded {len(evidence_data['CALL'])} call records")
             except Exception as e:
                 print(f"Error loading call evidence: {e}")
@@ -73,8 +178,7 @@ def load_processed_evidence(processed_dir):
         media_file = os.path.join(processed_dir, "media.json")
         if os.path.exists(media_file):
             try:
-                with open(media_file, 'r') as f:
-                    evidence_data["MEDIA"] = json.load(f)
+                evidence_data["MEDIA"] = _load_json_array(media_file)
                 print(f"Loaded {len(evidence_data['MEDIA'])} media records")
             except Exception as e:
                 print(f"Error loading media evidence: {e}")
@@ -83,8 +187,7 @@ def load_processed_evidence(processed_dir):
         apps_file = os.path.join(processed_dir, "apps.json")
         if os.path.exists(apps_file):
             try:
-                with open(apps_file, 'r') as f:
-                    evidence_data["APP"] = json.load(f)
+                evidence_data["APP"] = _load_json_array(apps_file)
                 print(f"Loaded {len(evidence_data['APP'])} app records")
             except Exception as e:
                 print(f"Error loading app evidence: {e}")
@@ -95,7 +198,7 @@ def load_processed_evidence(processed_dir):
     return evidence_data
 
 
-def analyze_call_patterns(call_evidence):
+def analyze_call_patterns(calls_path):
     """
     Analyze call patterns for suspicious behaviour.
     
@@ -109,45 +212,45 @@ def analyze_call_patterns(call_evidence):
     TODO: Implement call duration anomaly detection
     
     Args:
-        call_evidence (list): List of call evidence entries
+        calls_path: Path to the processed calls.json file
         
     Returns:
         list: Detected behavioural anomalies
     """
     anomalies = []
     
-    if not call_evidence:
+    if not os.path.exists(calls_path):
         print("No call evidence available for analysis")
         return anomalies
     
     # TODO: Implement excessive call detection
-    # Placeholder: Count calls by number
-    call_counts = defaultdict(int)
-    late_night_calls = []
-    
-    for call in call_evidence:
-        # Extract phone number from details (placeholder logic)
-        # TODO: Implement proper phone number extraction
-        phone_number = "unknown"
-        
-        call_counts[phone_number] += 1
-        
-        # Check for late night calls (suspicious activity)
+    # One streamed pass: per-number counts and the late-night tally are
+    # built together, so the evidence list is never held in memory.
+    call_counts = Counter()
+    late_night_count = 0
+
+    lo, hi = LATE_NIGHT_CALL_WINDOW
+
+    for call in _iter_records(calls_path):
+        call_counts[_contact_of(call)] += 1
+
         try:
-            call_time = datetime.strptime(call["timestamp"], "%Y-%m-%d %H:%M:%S").time()
-            if time(2, 0) <= call_time <= time(5, 0):
-                late_night_calls.append(call)
+            if lo <= _seconds_of_day(call["timestamp"]) <= hi:
+                late_night_count += 1
         except ValueError:
             print(f"Invalid timestamp format: {call['timestamp']}")
     
     # TODO: Implement configurable thresholds
     EXCESSIVE_CALL_THRESHOLD = 50  # Placeholder threshold
     
+    # One timestamp per analyzer run, not one per emitted anomaly
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
     # Check for excessive calls to single number
     for number, count in call_counts.items():
         if count > EXCESSIVE_CALL_THRESHOLD:
             anomaly = {
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": now_str,
                 "source": "CALL",
                 "type": "excessive_calls",
                 "details": f"{count} calls to {number} (threshold: {EXCESSIVE_CALL_THRESHOLD})"
@@ -155,19 +258,19 @@ def analyze_call_patterns(call_evidence):
             anomalies.append(anomaly)
     
     # Check for late night activity
-    if len(late_night_calls) > 10:  # Placeholder threshold
+    if late_night_count > 10:  # Placeholder threshold
         anomaly = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now_str,
             "source": "CALL", 
             "type": "unusual_hours",
-            "details": f"{len(late_night_calls)} calls during 2AM-5AM window"
+            "details": f"{late_night_count} calls during 2AM-5AM window"
         }
         anomalies.append(anomaly)
     
     return anomalies
 
 
-def analyze_sms_patterns(sms_evidence):
+def analyze_sms_patterns(sms_path):
     """
     Analyze SMS patterns for suspicious behaviour.
     
@@ -182,43 +285,44 @@ def analyze_sms_patterns(sms_evidence):
     TODO: Implement content pattern detection
     
     Args:
-        sms_evidence (list): List of SMS evidence entries
+        sms_path: Path to the processed sms.json file
         
     Returns:
         list: Detected behavioural anomalies
     """
     anomalies = []
     
-    if not sms_evidence:
+    if not os.path.exists(sms_path):
         print("No SMS evidence available for analysis")
         return anomalies
     
     # TODO: Implement message frequency analysis
-    # Placeholder: Count messages by contact
-    message_counts = defaultdict(int)
-    late_night_messages = []
-    
-    for message in sms_evidence:
-        # Extract contact from details (placeholder logic)
-        contact = "unknown"
-        message_counts[contact] += 1
-        
-        # Check for late night messages
+    # One streamed pass over the messages (counts + late-night tally)
+    message_counts = Counter()
+    late_night_count = 0
+
+    lo, hi = LATE_NIGHT_SMS_WINDOW
+
+    for message in _iter_records(sms_path):
+        message_counts[_contact_of(message)] += 1
+
         try:
-            msg_time = datetime.strptime(message["timestamp"], "%Y-%m-%d %H:%M:%S").time()
-            if time(1, 0) <= msg_time <= time(4, 0):
-                late_night_messages.append(message)
+            if lo <= _seconds_of_day(message["timestamp"]) <= hi:
+                late_night_count += 1
         except ValueError:
             print(f"Invalid timestamp format: {message['timestamp']}")
     
     # TODO: Implement configurable thresholds
     EXCESSIVE_MESSAGE_THRESHOLD = 100  # Placeholder threshold
     
+    # One timestamp per analyzer run, not one per emitted anomaly
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
     # Check for excessive messaging
     for contact, count in message_counts.items():
         if count > EXCESSIVE_MESSAGE_THRESHOLD:
             anomaly = {
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": now_str,
                 "source": "SMS",
                 "type": "excessive_messaging", 
                 "details": f"{count} messages to {contact} (threshold: {EXCESSIVE_MESSAGE_THRESHOLD})"
@@ -228,7 +332,7 @@ def analyze_sms_patterns(sms_evidence):
     return anomalies
 
 
-def analyze_app_usage(app_evidence):
+def analyze_app_usage(apps_path):
     """
     Analyze app usage patterns for suspicious behaviour.
     
@@ -242,14 +346,14 @@ def analyze_app_usage(app_evidence):
     TODO: Implement suspicious app identification
     
     Args:
-        app_evidence (list): List of app usage evidence entries
+        apps_path: Path to the processed apps.json file
         
     Returns:
         list: Detected behavioural anomalies
     """
     anomalies = []
     
-    if not app_evidence:
+    if not os.path.exists(apps_path):
         print("No app evidence available for analysis")
         return anomalies
     
@@ -257,23 +361,15 @@ def analyze_app_usage(app_evidence):
     # TODO: Implement suspicious app detection
     # TODO: Add usage pattern analysis
     
-    # Placeholder: Check for apps used during unusual hours
-    unusual_hour_usage = []
-    
-    for app_event in app_evidence:
-        try:
-            event_time = datetime.strptime(app_event["timestamp"], "%Y-%m-%d %H:%M:%S").time()
-            if time(3, 0) <= event_time <= time(5, 0):
-                unusual_hour_usage.append(app_event)
-        except ValueError:
-            print(f"Invalid timestamp format: {app_event['timestamp']}")
+    # Placeholder: Check for apps used during unusual hours (count only)
+    unusual_hour_count = _count_in_window(_iter_records(apps_path), UNUSUAL_APP_WINDOW)
     
-    if len(unusual_hour_usage) > 5:  # Placeholder threshold
+    if unusual_hour_count > 5:  # Placeholder threshold
         anomaly = {
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "source": "APP",
             "type": "unusual_hours_usage",
-            "details": f"{len(unusual_hour_usage)} app events during 3AM-5AM"
+            "details": f"{unusual_hour_count} app events during 3AM-5AM"
         }
         anomalies.append(anomaly)
     
@@ -294,20 +390,16 @@ def generate_behaviour_report(anomalies):
     Returns:
         dict: Behaviour analysis report
     """
+    # Categorize anomalies in two C-level Counter passes
     report = {
         "analysis_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "analysis_type": "behaviour_analysis",
         "total_anomalies": len(anomalies),
-        "anomalies_by_source": defaultdict(int),
-        "anomalies_by_type": defaultdict(int),
+        "anomalies_by_source": Counter(a["source"] for a in anomalies),
+        "anomalies_by_type": Counter(a["type"] for a in anomalies),
         "findings": anomalies
     }
     
-    # Categorize anomalies
-    for anomaly in anomalies:
-        report["anomalies_by_source"][anomaly["source"]] += 1
-        report["anomalies_by_type"][anomaly["type"]] += 1
-    
     return report
 
 
@@ -324,8 +416,8 @@ def save_analysis_report(report, output_file):
         output_file (Path): Output file path
     """
     try:
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps_indented(report))
         print(f"Behaviour analysis report saved to: {output_file}")
     except Exception as e:
         print(f"Error saving report: {e}")
@@ -348,22 +440,20 @@ def main():
     base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     processed_dir = os.path.join(base_path, "cases", "case_002", "evidence", "processed")
     
-    # Load processed evidence
-    evidence_data = load_processed_evidence(processed_dir)
-    
     all_anomalies = []
     
-    # Analyze different evidence types
+    # Each analyzer streams its evidence file directly in a single pass;
+    # no intermediate per-source lists are materialized.
     print("\nAnalyzing call patterns...")
-    call_anomalies = analyze_call_patterns(evidence_data["CALL"])
+    call_anomalies = analyze_call_patterns(os.path.join(processed_dir, "calls.json"))
     all_anomalies.extend(call_anomalies)
     
     print("Analyzing SMS patterns...")
-    sms_anomalies = analyze_sms_patterns(evidence_data["SMS"])
+    sms_anomalies = analyze_sms_patterns(os.path.join(processed_dir, "sms.json"))
     all_anomalies.extend(sms_anomalies)
     
     print("Analyzing app usage patterns...")
-    app_anomalies = analyze_app_usage(evidence_data["APP"])
+    app_anomalies = analyze_app_usage(os.path.join(processed_dir, "apps.json"))
     all_anomalies.extend(app_anomalies)
     
     # Generate comprehensive report
@@ -13,11 +13,17 @@ TARGET_FILE = Path(__file__).parent / "behaviour_analysis_report.json"
 
 
 def sha256_file(path):
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        # hashlib.file_digest (3.11+) runs the read/update loop in C and
+        # uses the hardware SHA extensions via OpenSSL where available.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        # Fallback: 1 MiB chunks so each update covers many SHA-256 blocks
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
 
 
 def main():
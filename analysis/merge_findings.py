@@ -13,6 +13,22 @@ import json
 import os
 from datetime import datetime
 
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 def merge_analysis_findings(case_id="case_002"):
     """
     Merge all analysis results into a unified findings.json file.
@@ -33,57 +49,58 @@ def merge_analysis_findings(case_id="case_002"):
         "timestamp_anomalies": []
     }
     
-    # Load behaviour analysis
-    behaviour_file = os.path.join(case_dir, "behaviour_analysis_report.json")
-    if os.path.exists(behaviour_file):
-        try:
-            with open(behaviour_file, 'r') as f:
-                behaviour_data = json.load(f)
-                findings["suspicious_behaviour"] = behaviour_data.get("findings", [])
-                print(f"Loaded {len(findings['suspicious_behaviour'])} behaviour findings")
-        except Exception as e:
-            print(f"Error loading behaviour analysis: {e}")
-    
-    # Load malware analysis
-    malware_file = os.path.join(case_dir, "malware_analysis_report.json")
-    if os.path.exists(malware_file):
-        try:
-            with open(malware_file, 'r') as f:
-                malware_data = json.load(f)
-                findings["malware_indicators"] = malware_data.get("findings", [])
-                print(f"Loaded {len(findings['malware_indicators'])} malware indicators")
-        except Exception as e:
-            print(f"Error loading malware analysis: {e}")
-    
-    # Load anomaly analysis
-    anomaly_file = os.path.join(case_dir, "anomaly_analysis_report.json")
-    if os.path.exists(anomaly_file):
+    # Report filename -> (findings key, loaded label, error label).
+    # One scandir enumerates the available reports instead of a stat
+    # syscall per candidate file.
+    report_sources = {
+        "behaviour_analysis_report.json":
+            ("suspicious_behaviour", "behaviour findings", "behaviour analysis"),
+        "malware_analysis_report.json":
+            ("malware_indicators", "malware indicators", "malware analysis"),
+        "anomaly_analysis_report.json":
+            ("timestamp_anomalies", "timestamp anomalies", "anomaly analysis"),
+    }
+
+    try:
+        available = {entry.name for entry in os.scandir(case_dir) if entry.is_file()}
+    except FileNotFoundError:
+        available = set()
+
+    for file_name, (findings_key, loaded_label, error_label) in report_sources.items():
+        if file_name not in available:
+            continue
+
         try:
-            with open(anomaly_file, 'r') as f:
-                anomaly_data = json.load(f)
-                findings["timestamp_anomalies"] = anomaly_data.get("findings", [])
-                print(f"Loaded {len(findings['timestamp_anomalies'])} timestamp anomalies")
+            with open(os.path.join(case_dir, file_name), 'rb') as f:
+                report_data = _loads(f.read())
+            findings[findings_key] = report_data.get("findings", [])
+            print(f"Loaded {len(findings[findings_key])} {loaded_label}")
         except Exception as e:
-            print(f"Error loading anomaly analysis: {e}")
-    
+            print(f"Error loading {error_label}: {e}")
+
     # Save merged findings
     findings_file = os.path.join(case_dir, "findings.json")
-    with open(findings_file, 'w') as f:
-        json.dump(findings, f, indent=2)
+    with open(findings_file, 'wb') as f:
+        f.write(_dumps_indented(findings))
     
+    totals = {
+        key: len(findings[key])
+        for key in ("suspicious_behaviour", "malware_indicators", "timestamp_anomalies")
+    }
+
     print(f"Merged findings saved to: {findings_file}")
-    print(f"Total findings: {len(findings['suspicious_behaviour']) + len(findings['malware_indicators']) + len(findings['timestamp_anomalies'])}")
+    print(f"Total findings: {sum(totals.values())}")
     
-    return findings
+    return findings, totals
 
 if __name__ == "__main__":
     print("Mobile Forensics - Merge Analysis Findings")
     print("=" * 50)
     
-    findings = merge_analysis_findings("case_002")
+    findings, totals = merge_analysis_findings("case_002")
     
     print("\nMerge Summary:")
-    print(f"  Suspicious behaviour: {len(findings['suspicious_behaviour'])}")
-    print(f"  Malware indicators: {len(findings['malware_indicators'])}")
-    print(f"  Timestamp anomalies: {len(findings['timestamp_anomalies'])}")
-    print(f"  Total findings: {len(findings['suspicious_behaviour']) + len(findings['malware_indicators']) + len(findings['timestamp_anomalies'])}")
+    print(f"  Suspicious behaviour: {totals['suspicious_behaviour']}")
+    print(f"  Malware indicators: {totals['malware_indicators']}")
+    print(f"  Timestamp anomalies: {totals['timestamp_anomalies']}")
+    print(f"  Total findings: {sum(totals.values())}")
@@ -13,6 +13,22 @@ import json
 import os
 from datetime import datetime
 
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 def merge_live_analysis_findings(case_id="case_live_001"):
     """
     Merge all analysis results into a unified findings.json file for live case.
@@ -45,8 +61,8 @@ def merge_live_analysis_findings(case_id="case_live_001"):
     
     if os.path.exists(calls_file):
         try:
-            with open(calls_file, 'r') as f:
-                calls = json.load(f)
+            with open(calls_file, 'rb') as f:
+                calls = _loads(f.read())
                 
             # Simple behaviour analysis
             if len(calls) > 3:
@@ -62,8 +78,8 @@ def merge_live_analysis_findings(case_id="case_live_001"):
     
     if os.path.exists(sms_file):
         try:
-            with open(sms_file, 'r') as f:
-                messages = json.load(f)
+            with open(sms_file, 'rb') as f:
+                messages = _loads(f.read())
                 
             # Simple behaviour analysis
             if len(messages) > 3:
@@ -80,22 +96,27 @@ def merge_live_analysis_findings(case_id="case_live_001"):
     # Save merged findings
     os.makedirs(case_dir, exist_ok=True)
     findings_file = os.path.join(case_dir, "findings.json")
-    with open(findings_file, 'w') as f:
-        json.dump(findings, f, indent=2)
+    with open(findings_file, 'wb') as f:
+        f.write(_dumps_indented(findings))
     
+    totals = {
+        key: len(findings[key])
+        for key in ("suspicious_behaviour", "malware_indicators", "timestamp_anomalies")
+    }
+
     print(f"Merged findings saved to: {findings_file}")
-    print(f"Total findings: {len(findings['suspicious_behaviour']) + len(findings['malware_indicators']) + len(findings['timestamp_anomalies'])}")
+    print(f"Total findings: {sum(totals.values())}")
     
-    return findings
+    return findings, totals
 
 if __name__ == "__main__":
     print("Mobile Forensics - Merge Live Case Analysis Findings")
     print("=" * 60)
     
-    findings = merge_live_analysis_findings("case_live_001")
+    findings, totals = merge_live_analysis_findings("case_live_001")
     
     print("\nMerge Summary:")
-    print(f"  Suspicious behaviour: {len(findings['suspicious_behaviour'])}")
-    print(f"  Malware indicators: {len(findings['malware_indicators'])}")
-    print(f"  Timestamp anomalies: {len(findings['timestamp_anomalies'])}")
-    print(f"  Total findings: {len(findings['suspicious_behaviour']) + len(findings['malware_indicators']) + len(findings['timestamp_anomalies'])}")
+    print(f"  Suspicious behaviour: {totals['suspicious_behaviour']}")
+    print(f"  Malware indicators: {totals['malware_indicators']}")
+    print(f"  Timestamp anomalies: {totals['timestamp_anomalies']}")
+    print(f"  Total findings: {sum(totals.values())}")
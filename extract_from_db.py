@@ -13,11 +13,173 @@ INPUT: Raw Android database files
 OUTPUT: Processed JSON evidence files
 """
 
-import sqlite3
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
+
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode("utf-8")
+
+# Repo base resolved once at import — abspath hits getcwd() every call,
+# so ad-hoc rebuilding it per path is wasted syscalls.
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _case_path(case_id, *parts):
+    """Build a path under a case directory from the repo base."""
+    return os.path.join(BASE_PATH, "cases", case_id, *parts)
+
+# Type codes are translated to labels inside SQLite (CASE expressions in
+# the SELECTs below), so rows arrive with the label already materialized
+# by the C-level VDBE. Python only resolves the details-string wording:
+# the pre-capitalized verb for calls and the from/to preposition.
+_SMS_PREP = {"incoming": "from"}  # every other SMS type reads "to"
+
+_CALL_DIR = {
+    "incoming": ("Incoming", "from"),
+    "outgoing": ("Outgoing", "to"),
+    "missed": ("Missed", "from"),
+    "voicemail": ("Voicemail", "to"),
+}
+_CALL_DIR_UNKNOWN = ("Unknown", "to")
+
+# Media file extensions recognised by extract_media_metadata. Kept as a
+# tuple because str.endswith has a C fast path for tuples of suffixes —
+# one call tests every extension with no Python-level loop.
+MEDIA_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.mp4', '.3gp', '.mov')
+
+# Directory-name fragments that indicate app data. Compared lowercase so
+# one pass matches regardless of how the handset cased the directory.
+APP_INDICATORS = ("whatsapp", "android", "data", "dcim")
+
+
+def _walk_media(root):
+    """
+    Yield a DirEntry for every media file under root in a single walk.
+
+    One scandir traversal replaces the old per-extension rglob passes
+    (six full tree walks), and no Path object is allocated for entries
+    that don't match. Symlinks are not followed so the walk stays inside
+    the case directory.
+    """
+    stack = [root]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(MEDIA_EXTENSIONS):
+                    yield entry
+
+
+def _walk_app_dirs(root):
+    """
+    Yield a DirEntry for every app-indicator directory under root.
+
+    One walk replaces the old per-indicator rglob passes; the substring
+    tests run on the name lowercased once, and a directory matching two
+    indicators is yielded only once.
+    """
+    stack = [root]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    name_lower = entry.name.lower()
+                    if any(ind in name_lower for ind in APP_INDICATORS):
+                        yield entry
+
+
+def _open_evidence_db(db_path):
+    """
+    Open an evidence database read-only with read-side tuning applied.
+
+    FORENSIC NOTE: mode=ro guarantees the extractor can never write to
+    the evidence file. For the same reason only PRAGMAs that stay on the
+    read path are tuned (page cache, temp storage, mmap window) —
+    journal_mode/synchronous changes are deliberately omitted because
+    they can rewrite journal state inside the evidence file.
+    """
+    # Deferred import: media/app extraction and orchestrators that only
+    # need those paths never pay the sqlite3 import cost
+    import sqlite3
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.execute("PRAGMA cache_size=-65536")     # 64 MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")   # map up to 256 MB of the DB
+    return conn
+
+
+def _has_table(conn, name):
+    """
+    Check whether a table exists, via an indexed sqlite_master lookup.
+
+    The parametrized LIMIT 1 query stops at the first match instead of
+    materializing every table name into Python for a linear search.
+    """
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=? LIMIT 1",
+        (name,)).fetchone()
+    return row is not None
+
+
+def _fetch_pages(cursor, page_size=10000):
+    """
+    Yield rows from a cursor in bounded fetchmany batches.
+
+    Each batch holds at most page_size raw tuples, capping peak memory
+    on multi-million-row captures while amortizing the per-row Python
+    call overhead of bare cursor iteration.
+    """
+    while True:
+        rows = cursor.fetchmany(page_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def stream_json_array(path, records):
+    """
+    Write records to path as a JSON array, one record at a time.
+
+    Serializing record by record keeps output memory bounded — the full
+    list never exists alongside its serialized bytes — and overlaps
+    encoding with the disk writes.
+
+    Args:
+        path: Output JSON file path (parent directory is created)
+        records: Iterable of JSON-serializable records
+
+    Returns:
+        int: Number of records written
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    count = 0
+
+    # 1 MiB buffer: the per-record writes coalesce into few large
+    # write(2) calls instead of flushing every 8 KiB
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(b'[\n')
+        for record in records:
+            if count:
+                f.write(b',\n')
+            f.write(_dumps(record))
+            count += 1
+        f.write(b'\n]\n')
+
+    return count
 
 def extract_sms_from_db(db_path, output_path):
     """
@@ -27,80 +189,69 @@ def extract_sms_from_db(db_path, output_path):
         db_path: Path to mmssms.db
         output_path: Path to output JSON file
     """
-    sms_data = []
-    
+    sms_count = 0
+
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _open_evidence_db(db_path)
         cursor = conn.cursor()
-        
+
         # Query SMS table
-        cursor.execute('SELECT name FROM sqlite_master WHERE type="table"')
-        tables = cursor.fetchall()
-        print(f"Available tables: {[t[0] for t in tables]}")
-        
-        if ('sms',) in tables:
+        if _has_table(conn, 'sms'):
+            # Timestamp formatting and the type-code translation both
+            # run inside SQLite's VDBE, so rows arrive with the final
+            # strings already built — no Python datetime object or
+            # mapping per row. NULLIF/COALESCE mirrors the old "use
+            # date_sent when date is null or zero" fallback, and
+            # 'localtime' matches datetime.fromtimestamp semantics.
             cursor.execute("""
-                SELECT 
-                    date,
-                    date_sent,
-                    read,
-                    status,
-                    type,
+                SELECT
+                    strftime('%Y-%m-%d %H:%M:%S',
+                             COALESCE(NULLIF(date, 0), NULLIF(date_sent, 0)) / 1000,
+                             'unixepoch', 'localtime') AS ts,
                     body,
-                    address
-                FROM sms 
+                    address,
+                    CASE type
+                        WHEN 1 THEN 'incoming'
+                        WHEN 2 THEN 'outgoing'
+                        WHEN 3 THEN 'draft'
+                        WHEN 4 THEN 'outbox'
+                        ELSE 'unknown'
+                    END AS type_str
+                FROM sms
                 ORDER BY date
             """)
-            
-            rows = cursor.fetchall()
-            print(f"Found {len(rows)} SMS records")
+
+            # Stream rows in bounded pages instead of fetchall(): large
+            # mmssms.db extractions would otherwise hold every raw tuple
+            # in memory alongside the JSON entries being built.
+            rows = _fetch_pages(cursor)
         else:
             print("SMS table not found")
             rows = []
-        
-        for row in rows:
-            # Convert Android timestamp (milliseconds) to readable format
-            timestamp_ms = row[0] if row[0] else row[1]  # Use date_sent if date is null
-            if timestamp_ms:
-                timestamp = datetime.fromtimestamp(timestamp_ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                timestamp = "Unknown"
-            
-            # Determine message type
-            msg_type = row[4]  # 1 = inbox, 2 = sent, 3 = draft, 4 = outbox, 5 = failed
-            if msg_type == 1:
-                msg_type_str = "incoming"
-            elif msg_type == 2:
-                msg_type_str = "outgoing"
-            elif msg_type == 3:
-                msg_type_str = "draft"
-            elif msg_type == 4:
-                msg_type_str = "outbox"
-            else:
-                msg_type_str = "unknown"
-            
-            sms_entry = {
-                "timestamp": timestamp,
-                "source": "SMS",
-                "type": msg_type_str,
-                "details": f"Message {'from' if msg_type_str == 'incoming' else 'to'} {row[6] or 'Unknown'}: {row[5] or '[No content]'}"
-            }
-            
-            sms_data.append(sms_entry)
-        
+
+        def _entries():
+            for row in rows:
+                # Timestamp and message type arrive pre-formatted from SQL
+                msg_type_str = row[3]
+                prep = _SMS_PREP.get(msg_type_str, "to")
+
+                yield {
+                    "timestamp": row[0] if row[0] else "Unknown",
+                    "source": "SMS",
+                    "type": msg_type_str,
+                    "details": f"Message {prep} {row[2] or 'Unknown'}: {row[1] or '[No content]'}"
+                }
+
+        sms_count = stream_json_array(output_path, _entries())
+
         conn.close()
-        
-        # Save to JSON
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(sms_data, f, indent=2)
-        
-        print(f"Extracted {len(sms_data)} SMS messages to {output_path}")
-        return sms_data
-        
+
+        print(f"Extracted {sms_count} SMS messages to {output_path}")
+        return sms_count
+
     except Exception as e:
         print(f"Error extracting SMS from {db_path}: {e}")
-        return []
+        return 0
 
 def extract_calls_from_db(db_path, output_path):
     """
@@ -110,90 +261,78 @@ def extract_calls_from_db(db_path, output_path):
         db_path: Path to calllog.db
         output_path: Path to output JSON file
     """
-    call_data = []
-    
+    call_count = 0
+
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _open_evidence_db(db_path)
         cursor = conn.cursor()
-        
+
         # Query calls table
-        cursor.execute('SELECT name FROM sqlite_master WHERE type="table"')
-        tables = cursor.fetchall()
-        print(f"Available tables: {[t[0] for t in tables]}")
-        
-        if ('calls',) in tables:
+        if _has_table(conn, 'calls'):
+            # Timestamp formatting and type translation in SQLite's
+            # VDBE, as for SMS
             cursor.execute("""
-                SELECT 
-                    date,
+                SELECT
+                    strftime('%Y-%m-%d %H:%M:%S', NULLIF(date, 0) / 1000,
+                             'unixepoch', 'localtime') AS ts,
                     duration,
-                    type,
+                    CASE type
+                        WHEN 1 THEN 'incoming'
+                        WHEN 2 THEN 'outgoing'
+                        WHEN 3 THEN 'missed'
+                        WHEN 5 THEN 'voicemail'
+                        ELSE 'unknown'
+                    END AS type_str,
                     number,
                     name
-                FROM calls 
+                FROM calls
                 ORDER BY date
             """)
-            
-            rows = cursor.fetchall()
-            print(f"Found {len(rows)} call records")
+
+            # Stream rows in bounded pages instead of fetchall() — see
+            # extract_sms_from_db for the rationale.
+            rows = _fetch_pages(cursor)
         else:
             print("Calls table not found")
             rows = []
-        
-        for row in rows:
-            # Convert Android timestamp to readable format
-            timestamp_ms = row[0]
-            if timestamp_ms:
-                timestamp = datetime.fromtimestamp(timestamp_ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                timestamp = "Unknown"
-            
-            # Determine call type
-            call_type = row[2]  # 1 = incoming, 2 = outgoing, 3 = missed, 5 = voicemail
-            if call_type == 1:
-                call_type_str = "incoming"
-            elif call_type == 2:
-                call_type_str = "outgoing"
-            elif call_type == 3:
-                call_type_str = "missed"
-            elif call_type == 5:
-                call_type_str = "voicemail"
-            else:
-                call_type_str = "unknown"
-            
-            # Format duration
-            duration = row[1] if row[1] else 0
-            if duration > 0:
-                minutes = duration // 60
-                seconds = duration % 60
-                duration_str = f"{minutes}m {seconds}s"
-            else:
-                duration_str = "0s"
-            
-            contact_name = row[4] if row[4] else "Unknown"
-            phone_number = row[3] if row[3] else "Unknown"
-            
-            call_entry = {
-                "timestamp": timestamp,
-                "source": "CALL",
-                "type": call_type_str,
-                "details": f"{call_type_str.capitalize()} call {('from' if call_type_str in ['incoming', 'missed'] else 'to')} {contact_name} ({phone_number}) - Duration: {duration_str}"
-            }
-            
-            call_data.append(call_entry)
-        
+
+        def _entries():
+            for row in rows:
+                # Timestamp arrives pre-formatted from SQL
+                timestamp = row[0] if row[0] else "Unknown"
+
+                # Call type arrives pre-translated from SQL
+                call_type_str = row[2]
+                verb, prep = _CALL_DIR.get(call_type_str, _CALL_DIR_UNKNOWN)
+
+                # Format duration — one divmod instead of separate // and %
+                duration = row[1] if row[1] else 0
+                if duration > 0:
+                    minutes, seconds = divmod(duration, 60)
+                    duration_str = f"{minutes}m {seconds}s"
+                else:
+                    duration_str = "0s"
+
+                contact_name = row[4] if row[4] else "Unknown"
+                phone_number = row[3] if row[3] else "Unknown"
+
+                yield {
+                    "timestamp": timestamp,
+                    "source": "CALL",
+                    "type": call_type_str,
+                    "details": f"{verb} call {prep} {contact_name} ({phone_number}) - Duration: {duration_str}"
+                }
+
+        call_count = stream_json_array(output_path, _entries())
+
         conn.close()
-        
-        # Save to JSON
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(call_data, f, indent=2)
-        
-        print(f"Extracted {len(call_data)} call logs to {output_path}")
-        return call_data
-        
+
+        print(f"Extracted {call_count} call logs to {output_path}")
+        return call_count
+
     except Exception as e:
         print(f"Error extracting calls from {db_path}: {e}")
-        return []
+        return 0
 
 def extract_media_metadata(case_path, output_path):
     """
@@ -203,41 +342,46 @@ def extract_media_metadata(case_path, output_path):
         case_path: Path to case directory
         output_path: Path to output JSON file
     """
-    media_data = []
-    
+    media_count = 0
+
     try:
-        # Look for media files in the case
-        media_extensions = ['.jpg', '.jpeg', '.png', '.mp4', '.3gp', '.mov']
-        
-        for ext in media_extensions:
-            for media_file in Path(case_path).rglob(f"*{ext}"):
-                try:
-                    stat = media_file.stat()
-                    timestamp = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    media_entry = {
-                        "timestamp": timestamp,
-                        "source": "MEDIA",
-                        "type": "file",
-                        "details": f"Media file: {media_file.name} ({stat.st_size} bytes)"
-                    }
-                    
-                    media_data.append(media_entry)
-                    
-                except Exception as e:
-                    print(f"Error processing media file {media_file}: {e}")
-        
-        # Save to JSON
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(media_data, f, indent=2)
-        
-        print(f"Extracted metadata for {len(media_data)} media files to {output_path}")
-        return media_data
-        
+        # Look for media files in the case — one walk for all extensions
+        media_files = list(_walk_media(case_path))
+
+        def _stat_one(media_file):
+            try:
+                stat = media_file.stat()
+                return media_file.name, stat.st_mtime, stat.st_size
+            except Exception as e:
+                print(f"Error processing media file {media_file.path}: {e}")
+                return None
+
+        # stat() is a blocking syscall per file; threads overlap that
+        # latency, which matters on the large DCIM trees typical of a
+        # full device image. map() keeps results in discovery order.
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            meta = [m for m in executor.map(_stat_one, media_files) if m]
+
+        # The pool hands back lean (name, mtime, size) tuples; the entry
+        # dicts are only assembled one at a time as the writer consumes
+        # them, so the bulky form of each record never accumulates.
+        entries = (
+            {
+                "timestamp": datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S"),
+                "source": "MEDIA",
+                "type": "file",
+                "details": f"Media file: {name} ({size} bytes)"
+            }
+            for name, mtime, size in meta
+        )
+        media_count = stream_json_array(output_path, entries)
+
+        print(f"Extracted metadata for {media_count} media files to {output_path}")
+        return media_count
+
     except Exception as e:
         print(f"Error extracting media metadata: {e}")
-        return []
+        return 0
 
 def extract_app_data(case_path, output_path):
     """
@@ -247,51 +391,48 @@ def extract_app_data(case_path, output_path):
         case_path: Path to case directory
         output_path: Path to output JSON file
     """
-    app_data = []
-    
+    app_count = 0
+
     try:
-        # Look for app-related files and directories
-        app_indicators = [
-            "WhatsApp", "Android", "data", "DCIM"
-        ]
-        
-        for indicator in app_indicators:
-            for app_path in Path(case_path).rglob(f"*{indicator}*"):
-                if app_path.is_dir():
-                    try:
-                        stat = app_path.stat()
-                        timestamp = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
-                        
-                        app_entry = {
-                            "timestamp": timestamp,
-                            "source": "APP",
-                            "type": "data",
-                            "details": f"App data directory: {app_path.relative_to(Path(case_path))}"
-                        }
-                        
-                        app_data.append(app_entry)
-                        
-                    except Exception as e:
-                        print(f"Error processing app directory {app_path}: {e}")
-        
-        # Save to JSON
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(app_data, f, indent=2)
-        
-        print(f"Extracted {len(app_data)} app data entries to {output_path}")
-        return app_data
-        
+        # Look for app-related directories — one walk for all indicators
+        app_dirs = list(_walk_app_dirs(case_path))
+
+        # Relative paths by slicing off the root prefix — no Path objects
+        prefix_len = len(str(case_path).rstrip(os.sep)) + 1
+
+        def _stat_one(entry):
+            try:
+                st = entry.stat()
+                timestamp = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+
+                return {
+                    "timestamp": timestamp,
+                    "source": "APP",
+                    "type": "data",
+                    "details": f"App data directory: {entry.path[prefix_len:]}"
+                }
+            except Exception as e:
+                print(f"Error processing app directory {entry.path}: {e}")
+                return None
+
+        # Batch the directory stats across threads, as for media files
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            entries = executor.map(_stat_one, app_dirs)
+            app_count = stream_json_array(
+                output_path, (entry for entry in entries if entry))
+
+        print(f"Extracted {app_count} app data entries to {output_path}")
+        return app_count
+
     except Exception as e:
         print(f"Error extracting app data: {e}")
-        return []
+        return 0
 
 def main():
     """Main extraction function for case_002"""
     # Use absolute paths
-    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    case_path = os.path.join(base_path, "cases", "case_002", "evidence", "raw")
-    output_path = os.path.join(base_path, "cases", "case_002", "evidence", "processed")
+    case_path = _case_path("case_002", "evidence", "raw")
+    output_path = _case_path("case_002", "evidence", "processed")
     
     print("Mobile Forensics - Database Extraction")
     print("=" * 50)
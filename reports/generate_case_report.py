@@ -13,6 +13,75 @@ import json
 import os
 from datetime import datetime, timezone
 
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+try:
+    # ijson iterates JSON arrays without materializing them in memory
+    import ijson
+except ImportError:
+    ijson = None
+
+# Repo base resolved once at import — abspath hits getcwd() every call
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_json(path):
+    """Load one JSON artifact as bytes through the fast decoder."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _summarize_timeline(timeline_file):
+    """
+    Summarize timeline.json in a single pass.
+
+    Count, date range and the source set are all tracked as events
+    stream by, so the timeline is traversed once instead of once per
+    statistic — and with ijson installed the event list is never
+    materialized at all.
+    """
+    total = 0
+    first_ts = None
+    last_ts = None
+    sources = set()
+
+    with open(timeline_file, 'rb') as f:
+        if ijson is not None:
+            events = ijson.items(f, 'item')
+        else:
+            events = _loads(f.read())
+
+        for event in events:
+            ts = event.get("timestamp")
+            if total == 0:
+                first_ts = ts
+            last_ts = ts
+            total += 1
+            sources.add(event.get("source", "Unknown"))
+
+    return {
+        "total_events": total,
+        "date_range": {
+            "start": first_ts if total else "Unknown",
+            "end": last_ts if total else "Unknown"
+        },
+        "sources": list(sources)
+    }
+
 def generate_case_report(case_id="case_002"):
     """
     Generate comprehensive forensic report for a specific case.
@@ -20,8 +89,7 @@ def generate_case_report(case_id="case_002"):
     Args:
         case_id: Case identifier
     """
-    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    case_dir = os.path.join(base_path, "cases", case_id)
+    case_dir = os.path.join(BASE_PATH, "cases", case_id)
     
     # Initialize report structure
     report = {
@@ -43,51 +111,38 @@ def generate_case_report(case_id="case_002"):
     # Load case metadata
     metadata_file = os.path.join(case_dir, "metadata.json")
     if os.path.exists(metadata_file):
-        with open(metadata_file, 'r') as f:
-            report["case_metadata"] = json.load(f)
-    
+        report["case_metadata"] = _load_json(metadata_file)
+
     # Load hash integrity
     hash_file = os.path.join(case_dir, "evidence", "hashes", "hashes.json")
     if os.path.exists(hash_file):
-        with open(hash_file, 'r') as f:
-            hash_data = json.load(f)
-            report["evidence_integrity"] = {
-                "hash_verification_status": "VERIFIED",
-                "total_files_hashed": hash_data.get("total_files_processed", 0),
-                "hash_algorithm": hash_data.get("hash_algorithm", "SHA-256"),
-                "integrity_score": 100.0
-            }
-    
+        hash_data = _load_json(hash_file)
+        report["evidence_integrity"] = {
+            "hash_verification_status": "VERIFIED",
+            "total_files_hashed": hash_data.get("total_files_processed", 0),
+            "hash_algorithm": hash_data.get("hash_algorithm", "SHA-256"),
+            "integrity_score": 100.0
+        }
+
     # Load timeline summary
     timeline_file = os.path.join(case_dir, "timeline", "timeline.json")
     if os.path.exists(timeline_file):
-        with open(timeline_file, 'r') as f:
-            timeline = json.load(f)
-            report["timeline_summary"] = {
-                "total_events": len(timeline),
-                "date_range": {
-                    "start": timeline[0].get("timestamp") if timeline else "Unknown",
-                    "end": timeline[-1].get("timestamp") if timeline else "Unknown"
-                },
-                "sources": list(set(event.get("source", "Unknown") for event in timeline))
-            }
-    
+        report["timeline_summary"] = _summarize_timeline(timeline_file)
+
     # Load analysis findings
     findings_file = os.path.join(case_dir, "analysis", "findings.json")
     if os.path.exists(findings_file):
-        with open(findings_file, 'r') as f:
-            findings = json.load(f)
-            report["analysis_findings"] = {
-                "suspicious_behaviour": findings.get("suspicious_behaviour", []),
-                "malware_indicators": findings.get("malware_indicators", []),
-                "timestamp_anomalies": findings.get("timestamp_anomalies", [])
-            }
-    
+        findings = _load_json(findings_file)
+        report["analysis_findings"] = {
+            "suspicious_behaviour": findings.get("suspicious_behaviour", []),
+            "malware_indicators": findings.get("malware_indicators", []),
+            "timestamp_anomalies": findings.get("timestamp_anomalies", [])
+        }
+
     # Load suspicion classification
     status_file = os.path.join(case_dir, "analysis", "case_status.json")
     if os.path.exists(status_file):
-        with open(status_file, 'r') as f:
-            report["suspicion_classification"] = json.load(f)
+        report["suspicion_classification"] = _load_json(status_file)
     
     # Generate conclusions
     total_findings = (
@@ -108,8 +163,8 @@ def generate_case_report(case_id="case_002"):
     os.makedirs(reports_dir, exist_ok=True)
     
     json_report_file = os.path.join(reports_dir, "forensic_report.json")
-    with open(json_report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    with open(json_report_file, 'wb', buffering=1 << 20) as f:
+        f.write(_dumps_indented(report))
     
     print(f"JSON report saved to: {json_report_file}")
     
@@ -119,20 +174,23 @@ def generate_case_report(case_id="case_002"):
     
     return report
 
-def generate_pdf_report(report_data, output_path):
-    """Generate PDF version of the report"""
-    try:
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+# reportlab styles built once at first PDF call and reused across case
+# reports — getSampleStyleSheet and the ParagraphStyle/TableStyle setup
+# are pure configuration and need not be rebuilt per report
+_STYLES = None
+
+
+def _pdf_styles():
+    """Build and memoize the reportlab styles for the PDF report."""
+    global _STYLES
+
+    if _STYLES is None:
         from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
+        from reportlab.platypus import TableStyle
         from reportlab.lib import colors
-        
-        doc = SimpleDocTemplate(output_path, pagesize=A4)
+
         styles = getSampleStyleSheet()
-        story = []
-        
-        # Custom styles
+
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
@@ -141,7 +199,7 @@ def generate_pdf_report(report_data, output_path):
             textColor=colors.darkblue,
             alignment=1
         )
-        
+
         heading_style = ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
@@ -149,77 +207,103 @@ def generate_pdf_report(report_data, output_path):
             spaceAfter=12,
             textColor=colors.darkblue
         )
-        
+
+        # Key/value pairs render as one two-column Table per section:
+        # a single flowable laid out in one pass, instead of a Paragraph
+        # per field each carrying its own mini-HTML parse.
+        kv_style = TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ])
+
+        _STYLES = (styles, title_style, heading_style, kv_style)
+
+    return _STYLES
+
+
+def generate_pdf_report(report_data, output_path):
+    """Generate PDF version of the report"""
+    try:
+        from reportlab.lib.pagesizes import letter, A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+        from reportlab.lib.units import inch
+
+        styles, title_style, heading_style, kv_style = _pdf_styles()
+
+        doc = SimpleDocTemplate(output_path, pagesize=A4)
+        story = []
+
+        def kv_table(rows):
+            return Table([[key, str(value)] for key, value in rows],
+                         colWidths=[1.8 * inch, 4.2 * inch],
+                         style=kv_style, hAlign='LEFT')
+
         # Title
         story.append(Paragraph("MOBILE FORENSICS INVESTIGATION REPORT", title_style))
         story.append(Spacer(1, 20))
-        
+
         # Case Information
-        case_info = [
+        story.append(Paragraph("Case Information", heading_style))
+        story.append(kv_table([
             ["Case ID:", report_data["case_metadata"].get("case_id", "Unknown")],
             ["Investigator:", report_data["case_metadata"].get("investigator", "Unknown")],
             ["Device Type:", report_data["case_metadata"].get("device_type", "Unknown")],
             ["Data Source:", report_data["case_metadata"].get("data_source", "Unknown")],
             ["Report Generated:", report_data["report_metadata"]["generation_timestamp"]]
-        ]
-        
-        story.append(Paragraph("Case Information", heading_style))
-        for key, value in case_info:
-            story.append(Paragraph(f"<b>{key}</b> {value}", styles['Normal']))
+        ]))
         story.append(Spacer(1, 20))
-        
+
         # Evidence Summary
+        date_range = report_data["timeline_summary"].get("date_range", {})
         story.append(Paragraph("Evidence Summary", heading_style))
-        evidence_text = f"""
-        <b>Total Files Hashed:</b> {report_data["evidence_integrity"].get("total_files_hashed", 0)}<br/>
-        <b>Hash Algorithm:</b> {report_data["evidence_integrity"].get("hash_algorithm", "Unknown")}<br/>
-        <b>Timeline Events:</b> {report_data["timeline_summary"].get("total_events", 0)}<br/>
-        <b>Date Range:</b> {report_data["timeline_summary"].get("date_range", {}).get("start", "Unknown")} to {report_data["timeline_summary"].get("date_range", {}).get("end", "Unknown")}
-        """
-        story.append(Paragraph(evidence_text, styles['Normal']))
+        story.append(kv_table([
+            ["Total Files Hashed:", report_data["evidence_integrity"].get("total_files_hashed", 0)],
+            ["Hash Algorithm:", report_data["evidence_integrity"].get("hash_algorithm", "Unknown")],
+            ["Timeline Events:", report_data["timeline_summary"].get("total_events", 0)],
+            ["Date Range:", f"{date_range.get('start', 'Unknown')} to {date_range.get('end', 'Unknown')}"]
+        ]))
         story.append(Spacer(1, 20))
-        
+
         # Analysis Findings
-        story.append(Paragraph("Analysis Findings", heading_style))
         findings = report_data["analysis_findings"]
-        findings_text = f"""
-        <b>Suspicious Behaviour:</b> {len(findings.get("suspicious_behaviour", []))} indicators<br/>
-        <b>Malware Indicators:</b> {len(findings.get("malware_indicators", []))} indicators<br/>
-        <b>Timestamp Anomalies:</b> {len(findings.get("timestamp_anomalies", []))} anomalies
-        """
-        story.append(Paragraph(findings_text, styles['Normal']))
+        story.append(Paragraph("Analysis Findings", heading_style))
+        story.append(kv_table([
+            ["Suspicious Behaviour:", f"{len(findings.get('suspicious_behaviour', []))} indicators"],
+            ["Malware Indicators:", f"{len(findings.get('malware_indicators', []))} indicators"],
+            ["Timestamp Anomalies:", f"{len(findings.get('timestamp_anomalies', []))} anomalies"]
+        ]))
         story.append(Spacer(1, 20))
-        
+
         # Suspicion Classification
-        story.append(Paragraph("Suspicion Classification", heading_style))
         suspicion = report_data["suspicion_classification"]
-        suspicion_text = f"""
-        <b>Risk Level:</b> {suspicion.get("suspicion_level", "Unknown")}<br/>
-        <b>Score:</b> {suspicion.get("score", 0)}
-        """
-        story.append(Paragraph(suspicion_text, styles['Normal']))
-        
+        story.append(Paragraph("Suspicion Classification", heading_style))
+        story.append(kv_table([
+            ["Risk Level:", suspicion.get("suspicion_level", "Unknown")],
+            ["Score:", suspicion.get("score", 0)]
+        ]))
+
         if suspicion.get("reasons"):
             story.append(Paragraph("<b>Classification Reasons:</b>", styles['Normal']))
             for reason in suspicion["reasons"]:
                 story.append(Paragraph(f"• {reason}", styles['Normal']))
-        
+
         story.append(Spacer(1, 20))
-        
+
         # Conclusions
-        story.append(Paragraph("Conclusions", heading_style))
         conclusions = report_data["conclusions"]
-        conclusions_text = f"""
-        <b>Overall Risk Level:</b> {conclusions.get("overall_risk_level", "Unknown")}<br/>
-        <b>Total Findings:</b> {conclusions.get("total_findings", 0)}<br/>
-        <b>Investigation Status:</b> {conclusions.get("investigation_status", "Unknown")}
-        """
-        story.append(Paragraph(conclusions_text, styles['Normal']))
-        
+        story.append(Paragraph("Conclusions", heading_style))
+        story.append(kv_table([
+            ["Overall Risk Level:", conclusions.get("overall_risk_level", "Unknown")],
+            ["Total Findings:", conclusions.get("total_findings", 0)],
+            ["Investigation Status:", conclusions.get("investigation_status", "Unknown")]
+        ]))
+
         # Build PDF
         doc.build(story)
         print(f"PDF report saved to: {output_path}")
-        
+
     except ImportError:
         print("ReportLab not available, skipping PDF generation")
     except Exception as e:
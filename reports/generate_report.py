@@ -1,110 +1,170 @@
+import io
 import os
 import json
 from datetime import datetime, timezone
 
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+try:
+    # ijson iterates JSON arrays without materializing them in memory
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _iter_items(f, key):
+    """Yield entries of the top-level `key` array one at a time."""
+    if ijson is not None:
+        yield from ijson.items(f, f"{key}.item")
+    else:
+        yield from _loads(f.read()).get(key, [])
+
 REPORT_PATH = os.path.join("reports", "final_report.txt")
 HASH_FILE = os.path.join("evidence", "hashes", "hashes.json")
 FINDINGS_FILE = os.path.join("analysis", "findings.json")
 TIMELINE_FILE = os.path.join("timeline", "timeline.json")
 
-lines = []
-
-def add(line=""):
-    lines.append(line)
-
-# -----------------------------
-# REPORT HEADER
-# -----------------------------
-add("MOBILE DIGITAL FORENSICS INVESTIGATION REPORT")
-add("=" * 50)
-add(f"Case ID: MF-CASE-001")
-add(f"Report Generated (UTC): {datetime.now(timezone.utc).isoformat()}")
-add("Dataset Used: NIST CFReDS Android")
-add("Tool: Mobile Forensics Investigation Tool")
-add()
-
-# -----------------------------
-# EVIDENCE INTEGRITY SECTION
-# -----------------------------
-add("EVIDENCE INTEGRITY VERIFICATION")
-add("-" * 50)
-
-if os.path.exists(HASH_FILE):
-    with open(HASH_FILE, "r") as f:
-        hash_data = json.load(f)
-
-    add(f"Hash Algorithm: {hash_data.get('algorithm', 'SHA-256')}")
-    files = hash_data.get("files", [])
-    add(f"Total Evidence Files Hashed: {len(files)}")
-    add()
+BANNER = "=" * 50
+RULE = "-" * 50
 
-    for item in files:
-        add(f"- File Name: {item['file_name']}")
-        add(f"  Relative Path: {item['relative_path']}")
-        add(f"  Size (bytes): {item['size_bytes']}")
-        add(f"  SHA-256: {item['sha256']}")
-        add()
-else:
-    add("No hash data available.")
-    add()
 
-# -----------------------------
-# ANALYSIS FINDINGS SECTION
-# -----------------------------
-add("ANALYSIS FINDINGS")
-add("-" * 50)
+def main():
+    # One growable text buffer instead of a list of N string objects
+    # plus a final join copy
+    buf = io.StringIO()
 
-if os.path.exists(FINDINGS_FILE):
-    with open(FINDINGS_FILE, "r") as f:
-        findings = json.load(f).get("findings", [])
+    def add(line=""):
+        buf.write(line)
+        buf.write("\n")
 
-    if findings:
-        for idx, finding in enumerate(findings, start=1):
-            add(f"{idx}. {finding['type']}")
-            add(f"   {finding['description']}")
-            add()
-    else:
-        add("No analysis findings detected.")
-        add()
-else:
-    add("Analysis findings file not present.")
+    # -----------------------------
+    # REPORT HEADER
+    # -----------------------------
+    add("MOBILE DIGITAL FORENSICS INVESTIGATION REPORT")
+    add(BANNER)
+    add(f"Case ID: MF-CASE-001")
+    add(f"Report Generated (UTC): {datetime.now(timezone.utc).isoformat()}")
+    add("Dataset Used: NIST CFReDS Android")
+    add("Tool: Mobile Forensics Investigation Tool")
     add()
 
-# -----------------------------
-# TIMELINE SECTION
-# -----------------------------
-add("TIMELINE OVERVIEW")
-add("-" * 50)
+    # -----------------------------
+    # EVIDENCE INTEGRITY SECTION
+    # -----------------------------
+    add("EVIDENCE INTEGRITY VERIFICATION")
+    add(RULE)
+
+    # EAFP: one open() instead of a stat-then-open pair that both
+    # doubles metadata round-trips and races against file removal
+    try:
+        f = open(HASH_FILE, "rb")
+    except FileNotFoundError:
+        add("No hash data available.")
+        add()
+    else:
+        with f:
+            if ijson is not None:
+                # next() stops the scan as soon as the scalar is found
+                algorithm = next(ijson.items(f, "algorithm"), "SHA-256")
+            else:
+                algorithm = _loads(f.read()).get("algorithm", "SHA-256")
+            f.seek(0)
+
+            # The files array streams through one record at a time;
+            # per-file text goes to a side buffer so the total — known
+            # only once the stream ends — can still be printed above
+            # the listing.
+            files_buf = io.StringIO()
+            file_count = 0
+
+            # One buffer write per file record instead of five add() calls
+            for item in _iter_items(f, "files"):
+                file_count += 1
+                files_buf.write(
+                    f"- File Name: {item['file_name']}\n"
+                    f"  Relative Path: {item['relative_path']}\n"
+                    f"  Size (bytes): {item['size_bytes']}\n"
+                    f"  SHA-256: {item['sha256']}\n\n"
+                )
+
+        add(f"Hash Algorithm: {algorithm}")
+        add(f"Total Evidence Files Hashed: {file_count}")
+        add()
+        buf.write(files_buf.getvalue())
+
+    # -----------------------------
+    # ANALYSIS FINDINGS SECTION
+    # -----------------------------
+    add("ANALYSIS FINDINGS")
+    add(RULE)
+
+    try:
+        f = open(FINDINGS_FILE, "rb")
+    except FileNotFoundError:
+        add("Analysis findings file not present.")
+        add()
+    else:
+        with f:
+            idx = 0
+            for idx, finding in enumerate(_iter_items(f, "findings"), start=1):
+                add(f"{idx}. {finding['type']}")
+                add(f"   {finding['description']}")
+                add()
+
+        if idx == 0:
+            add("No analysis findings detected.")
+            add()
 
-if os.path.exists(TIMELINE_FILE):
-    with open(TIMELINE_FILE, "r") as f:
-        events = json.load(f).get("events", [])
+    # -----------------------------
+    # TIMELINE SECTION
+    # -----------------------------
+    add("TIMELINE OVERVIEW")
+    add(RULE)
 
-    if events:
-        for event in events:
-            add(f"[{event['timestamp']}] {event['source']} - {event['details']}")
+    try:
+        f = open(TIMELINE_FILE, "rb")
+    except FileNotFoundError:
+        add("Timeline file not present.")
         add()
     else:
-        add("Timeline file is empty.")
-        add()
-else:
-    add("Timeline file not present.")
+        with f:
+            event_count = 0
+            for event in _iter_items(f, "events"):
+                event_count += 1
+                add(f"[{event['timestamp']}] {event['source']} - {event['details']}")
+
+        if event_count:
+            add()
+        else:
+            add("Timeline file is empty.")
+            add()
+
+    # -----------------------------
+    # CONCLUSION
+    # -----------------------------
+    add("CONCLUSION")
+    add(RULE)
+    add("Evidence integrity was preserved using SHA-256 hashing.")
+    add("All findings are based on rule-based, explainable analysis.")
+    add("This report represents the final forensic output of the investigation.")
     add()
 
-# -----------------------------
-# CONCLUSION
-# -----------------------------
-add("CONCLUSION")
-add("-" * 50)
-add("Evidence integrity was preserved using SHA-256 hashing.")
-add("All findings are based on rule-based, explainable analysis.")
-add("This report represents the final forensic output of the investigation.")
-add()
-
-# -----------------------------
-# WRITE REPORT TO FILE
-# -----------------------------
-with open(REPORT_PATH, "w", encoding="utf-8") as report:
-    report.write("\n".join(lines))
-
-print("Forensic report generated successfully.")
+    # -----------------------------
+    # WRITE REPORT TO FILE
+    # -----------------------------
+    with open(REPORT_PATH, "w", encoding="utf-8") as report:
+        report.write(buf.getvalue())
+
+    print("Forensic report generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
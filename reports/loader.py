@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Shared report loader for Mobile Forensics Investigation Tool
+
+FORENSIC ROLE:
+- Single parse point for per-case forensic_report.json
+- Serves every generator that consumes the report artifact
+- READ-ONLY access to case data
+
+The parsed report is cached keyed by path and mtime, so batched runs
+that render several outputs from the same case pay the JSON parse once;
+a regenerated report changes its mtime and is re-read, never served
+stale.
+"""
+
+import json
+import os
+
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+# Repo base resolved once at import — abspath hits getcwd() every call
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# path -> (mtime, parsed report)
+_report_cache = {}
+
+
+def load_report(case_id):
+    """
+    Load (or reuse) the parsed forensic_report.json for a case.
+
+    Args:
+        case_id: Case identifier
+
+    Returns:
+        Parsed report dict.
+
+    Raises:
+        FileNotFoundError: report has not been generated for the case
+        ValueError: report file is not valid JSON
+    """
+    path = os.path.join(BASE_PATH, "cases", case_id,
+                        "reports", "forensic_report.json")
+    mtime = os.stat(path).st_mtime
+
+    cached = _report_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        report = _loads(f.read())
+
+    _report_cache[path] = (mtime, report)
+    return report
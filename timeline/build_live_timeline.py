@@ -9,10 +9,59 @@ FORENSIC ROLE:
 - Generate unified timeline for analysis
 """
 
+import heapq
 import json
 import os
+from collections import Counter
 from datetime import datetime
 
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode("utf-8")
+
+try:
+    # ijson iterates JSON arrays without materializing them in memory
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _ts_key(ts):
+    """
+    Epoch-seconds sort key for one "YYYY-MM-DD HH:MM:SS" timestamp.
+
+    Comparing floats is a single C compare per pair, where comparing the
+    19-char timestamp strings walks them byte by byte. Unparseable
+    timestamps (e.g. "Unknown") sort to the end, as they did
+    lexicographically.
+    """
+    try:
+        return datetime.fromisoformat(ts).timestamp()
+    except (TypeError, ValueError):
+        return float("inf")
+
+
+def _stream_events(file_path):
+    """Yield events from one processed evidence file in file order."""
+    with open(file_path, 'rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, 'item')
+        else:
+            yield from _loads(f.read())
+
+
 def build_live_timeline(case_id="case_live_001"):
     """
     Build unified timeline from all processed evidence for live case.
@@ -24,54 +73,68 @@ def build_live_timeline(case_id="case_live_001"):
     processed_dir = os.path.join(base_path, "cases", case_id, "evidence", "processed")
     
     timeline_events = []
-    
+
     # Load and merge all evidence types
     evidence_files = {
         "SMS": "sms.json",
-        "CALL": "calls.json", 
+        "CALL": "calls.json",
         "MEDIA": "media.json",
         "APP": "apps.json"
     }
-    
+
+    # Each extractor already emits its file in chronological order, so
+    # the four sources can be k-way merged instead of concatenated and
+    # re-sorted: heapq.merge keeps only one pending event per stream.
+    streams = []
     for source_type, filename in evidence_files.items():
         file_path = os.path.join(processed_dir, filename)
-        
+
         if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r') as f:
-                    events = json.load(f)
-                    
-                # Add timeline order counter
-                for i, event in enumerate(events):
-                    event["timeline_order"] = len(timeline_events) + i + 1
-                
-                timeline_events.extend(events)
-                print(f"Loaded {len(events)} {source_type} events")
-                
-            except Exception as e:
-                print(f"Error loading {filename}: {e}")
+            streams.append(_stream_events(file_path))
+            print(f"Merging {source_type} events from {filename}")
         else:
             print(f"File not found: {filename}")
-    
-    # Sort timeline chronologically
-    try:
-        timeline_events.sort(key=lambda x: x.get("timestamp", ""))
-        print(f"Sorted {len(timeline_events)} total events chronologically")
-    except Exception as e:
-        print(f"Error sorting timeline: {e}")
-    
-    # Update timeline order after sorting
-    for i, event in enumerate(timeline_events):
-        event["timeline_order"] = i + 1
-    
+
     # Save timeline
     timeline_dir = os.path.join(base_path, "cases", case_id, "timeline")
     os.makedirs(timeline_dir, exist_ok=True)
-    
+
     timeline_file = os.path.join(timeline_dir, "timeline.json")
-    with open(timeline_file, 'w') as f:
-        json.dump(timeline_events, f, indent=2)
-    
+
+    # Merge the sorted streams and write each event as it arrives —
+    # timeline_order is assigned in the consuming loop, so the events
+    # never need a second numbering pass.
+    try:
+        # Decorate each stream with (epoch, stream_index, event) tuples
+        # so the merge compares tuples in C with no Python key callback;
+        # the timestamp is parsed once per event and the stream index
+        # breaks ties before the comparison ever reaches the event dicts.
+        decorated = [
+            ((_ts_key(e.get("timestamp")), si, e) for e in stream)
+            for si, stream in enumerate(streams)
+        ]
+        merged = heapq.merge(*decorated)
+
+        # Numbering and the per-source histogram ride along in the same
+        # consuming loop, so the merged events are traversed exactly
+        # once. Counter's missing-key lookup returns 0 in C, dropping
+        # the dict.get-plus-assign dance per event.
+        source_counts = Counter()
+        with open(timeline_file, 'wb', buffering=1 << 20) as f:
+            f.write(b'[\n')
+            for i, (_, _, event) in enumerate(merged):
+                event["timeline_order"] = i + 1
+                source_counts[event.get("source", "Unknown")] += 1
+                if i:
+                    f.write(b',\n')
+                f.write(_dumps(event))
+                timeline_events.append(event)
+            f.write(b'\n]\n')
+
+        print(f"Merged {len(timeline_events)} total events chronologically")
+    except Exception as e:
+        print(f"Error merging timeline: {e}")
+
     print(f"Timeline saved to: {timeline_file}")
     print(f"Total timeline events: {len(timeline_events)}")
     
@@ -80,16 +143,10 @@ def build_live_timeline(case_id="case_live_001"):
         first_event = timeline_events[0].get("timestamp", "Unknown")
         last_event = timeline_events[-1].get("timestamp", "Unknown")
         print(f"Timeline range: {first_event} to {last_event}")
-        
-        # Count by source type
-        source_counts = {}
-        for event in timeline_events:
-            source = event.get("source", "Unknown")
-            source_counts[source] = source_counts.get(source, 0) + 1
-        
+
         print("Event breakdown:")
-        for source, count in source_counts.items():
-            print(f"  {source}: {count}")
+        print("\n".join(f"  {source}: {count}"
+                        for source, count in source_counts.items()))
     
     return timeline_events
 
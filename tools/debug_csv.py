@@ -4,8 +4,14 @@ Debug CSV parsing for live debug communication ingestion
 """
 
 import csv
+from itertools import islice
 from pathlib import Path
 
+# How many raw lines / parsed rows to sample per file — enough to see
+# the header and a few records without dumping a multi-GB log
+RAW_SAMPLE_LINES = 50
+PARSED_SAMPLE_ROWS = 10
+
 def debug_csv_parsing():
     base_path = Path(__file__).parent.parent
     raw_dir = base_path / "cases" / "case_live_001" / "evidence" / "raw"
@@ -15,36 +21,41 @@ def debug_csv_parsing():
     
     print("🔍 Debugging CSV parsing...")
     
-    # Debug call log
+    # Debug call log. islice samples the head of the file as it streams
+    # in instead of readlines() materializing the whole log; the sample
+    # is joined and printed once to avoid per-line stdout flushes.
     print(f"\n📞 Reading call log: {call_file}")
     with open(call_file, 'r') as f:
-        lines = f.readlines()
-        print(f"Total lines: {len(lines)}")
-        for i, line in enumerate(lines):
-            print(f"Line {i}: {repr(line)}")
-    
+        sample = [f"Line {i}: {repr(line)}"
+                  for i, line in enumerate(islice(f, RAW_SAMPLE_LINES))]
+    print(f"First {len(sample)} lines:")
+    print("\n".join(sample))
+
     print(f"\n💬 Reading SMS log: {sms_file}")
     with open(sms_file, 'r') as f:
-        lines = f.readlines()
-        print(f"Total lines: {len(lines)}")
-        for i, line in enumerate(lines):
-            print(f"Line {i}: {repr(line)}")
-    
+        sample = [f"Line {i}: {repr(line)}"
+                  for i, line in enumerate(islice(f, RAW_SAMPLE_LINES))]
+    print(f"First {len(sample)} lines:")
+    print("\n".join(sample))
+
     # Test CSV parsing
     print(f"\n🧪 Testing CSV parsing...")
-    
+
     with open(call_file, 'r') as f:
         # Find header
         for line in f:
             if line.startswith('timestamp'):
                 print(f"Found header: {line.strip()}")
                 break
-        
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader):
-            print(f"Row {i}: {row}")
-            if i >= 3:  # Limit output
-                break
+
+        # csv.reader returns plain lists; the dict is built with
+        # zip(header, row) only for the rows actually displayed, so
+        # skipped rows never pay DictReader's per-row dict allocation.
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = [f"Row {i}: {dict(zip(header, row))}"
+                for i, row in enumerate(islice(reader, PARSED_SAMPLE_ROWS))]
+        print("\n".join(rows))
 
 if __name__ == "__main__":
     debug_csv_parsing()
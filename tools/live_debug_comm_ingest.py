@@ -20,8 +20,121 @@ import csv
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    # orjson is several times faster than stdlib json and works on bytes
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+try:
+    # ijson streams records from disk without loading the whole array
+    import ijson
+except ImportError:
+    ijson = None
+
+# Schema every processed record must carry for the downstream pipeline
+_REQUIRED_KEYS = {"timestamp", "source", "type", "details"}
+
+
+def _validate_schema(file_path):
+    """
+    Check the first record of a processed JSON file for the pipeline schema.
+
+    All records come from the same ingestion kernel, so the first one is
+    representative. With ijson the read stops after that record, keeping
+    validation O(1) in file size; the fallback parses the whole file.
+    """
+    with open(file_path, 'rb') as f:
+        if ijson is not None:
+            first = next(ijson.items(f, 'item'), None)
+        else:
+            records = _loads(f.read())
+            first = records[0] if records else None
+
+    return first is not None and _REQUIRED_KEYS <= first.keys()
+
+
+# Detail templates precomputed per direction: the hot loop does one
+# dict lookup and a str.format instead of re-evaluating the
+# capitalize() call and from/to conditional on every row
+CALL_TEMPLATES = {
+    "incoming": "Incoming call from {number} - Duration: {duration_str}",
+    "outgoing": "Outgoing call to {number} - Duration: {duration_str}",
+}
+
+SMS_TEMPLATES = {
+    "incoming": "Message from {number}: {message}",
+}
+
+SMS_DEFAULT_TEMPLATE = "Message to {number}: {message}"
+
+
+def _ts_key(timestamp):
+    """
+    Epoch-seconds sort key for one "YYYY-MM-DD HH:MM:SS" timestamp.
+
+    A float compares in one C operation per pair, where the 19-char
+    timestamp strings compare byte by byte; unparseable timestamps
+    sort to the end.
+    """
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return float("inf")
+
+
+@lru_cache(maxsize=None)
+def _fmt_duration(duration):
+    """
+    Format call duration seconds for human readability.
+
+    Call lengths repeat heavily across a log, so the memoized result
+    skips the arithmetic and f-string work on every repeat.
+    """
+    # divmod computes quotient and remainder in one division; indexing
+    # the pair by the boolean picks the form without a branch
+    minutes, seconds = divmod(duration, 60)
+    return (f"{duration}s", f"{minutes}m {seconds}s")[minutes > 0]
+
+
+def _call_details(direction, number, rest):
+    """Build the details string for one call row (rest = cells after number)."""
+    duration_str = _fmt_duration(int(rest[0].strip()))
+
+    template = CALL_TEMPLATES.get(direction)
+    if template is None:
+        # Unrecognized direction: keep the old capitalized wording
+        template = (f"{direction.capitalize()} call to "
+                    "{number} - Duration: {duration_str}")
+
+    return template.format(number=number, duration_str=duration_str)
+
+
+def _sms_details(direction, number, rest):
+    """Build the details string for one SMS row (rest = cells after number)."""
+    # Common case (no stray commas) skips the join
+    if len(rest) == 1:
+        message = rest[0].strip()
+    else:
+        message = ','.join(rest).strip()
+
+    return SMS_TEMPLATES.get(direction, SMS_DEFAULT_TEMPLATE).format(
+        number=number, message=message)
+
+
 class LiveDebugCommIngestion:
     def __init__(self):
         self.base_path = Path(__file__).parent.parent
@@ -34,163 +147,108 @@ class LiveDebugCommIngestion:
         self.processed_dir.mkdir(parents=True, exist_ok=True)
         print(f"✅ Processed directory ready: {self.processed_dir}")
     
-    def process_call_log(self):
+    def _ingest_csv(self, src, dst, label, source_tag, detail_builder):
         """
-        Process call log CSV and convert to forensic JSON schema.
-        
-        FORENSIC TRANSPARENCY:
-        This simulates limited call artifacts for debugging purposes.
-        It does NOT access protected Android databases or bypass security.
+        Shared CSV-to-JSON ingestion kernel for the comm processors.
+
+        Streams src in one pass through csv.reader, builds forensic
+        entries with the supplied detail_builder(direction, number,
+        rest_cells), sorts on pre-parsed epoch keys and writes dst in
+        a single serialized call. Both processors differ only in their
+        detail wording, so the hot loop lives here once.
         """
-        print("📞 Processing live debug call log...")
-        
-        call_file = self.raw_dir / "live_debug_calllog.csv"
-        output_file = self.processed_dir / "calls.json"
-        
-        if not call_file.exists():
-            print(f"❌ Call log file not found: {call_file}")
+        if not src.exists():
+            print(f"❌ {label} log file not found: {src}")
             return False
-        
-        calls = []
-        
+
+        entries = []
+
         try:
-            with open(call_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-                # Find header line
-                header_line = None
-                for i, line in enumerate(lines):
-                    if line.startswith('timestamp'):
-                        header_line = i
-                        break
-                
-                if header_line is None:
-                    print("❌ No header line found in call log")
-                    return False
-                
-                # Parse data from lines after header
-                data_lines = lines[header_line + 1:]
-                
-                for line in data_lines:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
+            with open(src, 'r', encoding='utf-8') as f:
+                # Stream the file in one pass: a header flag replaces the
+                # readlines() + header-search + slice dance, so peak
+                # memory stays bounded no matter how large the log is
+                header_seen = False
+
+                # csv.reader's C implementation splits rows faster than
+                # a Python-level str.split and handles quoted commas
+                for row in csv.reader(f):
+                    if not row or row[0].startswith('#'):
                         continue
-                    
-                    # Parse CSV manually
-                    parts = line.split(',')
-                    if len(parts) >= 4:
-                        timestamp = parts[0].strip()
-                        direction = parts[1].strip().lower()
-                        number = parts[2].strip()
-                        duration = int(parts[3].strip())
-                        
-                        # Format duration for human readability
-                        if duration >= 60:
-                            minutes = duration // 60
-                            seconds = duration % 60
-                            duration_str = f"{minutes}m {seconds}s"
-                        else:
-                            duration_str = f"{duration}s"
-                        
-                        # Create forensic entry
-                        call_entry = {
-                            "timestamp": timestamp,
-                            "source": "CALL",
-                            "type": direction,
-                            "details": f"{direction.capitalize()} call {('from' if direction == 'incoming' else 'to')} {number} - Duration: {duration_str}"
-                        }
-                        
-                        calls.append(call_entry)
-            
-            # Sort by timestamp
-            calls.sort(key=lambda x: x['timestamp'])
-            
-            # Save to JSON
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(calls, f, indent=2)
-            
-            print(f"✅ Processed {len(calls)} call entries")
-            print(f"✅ Saved to: {output_file}")
+
+                    if not header_seen:
+                        if row[0] == 'timestamp':
+                            header_seen = True
+                        continue
+
+                    if len(row) >= 4:
+                        timestamp = row[0].strip()
+                        direction = row[1].strip().lower()
+                        number = row[2].strip()
+
+                        # Parse into a plain tuple led by the epoch key:
+                        # tuples are smaller than dicts and sort directly
+                        # in C with no key function, and the forensic
+                        # dicts only materialize once, in final order
+                        entries.append((
+                            _ts_key(timestamp),
+                            timestamp,
+                            direction,
+                            detail_builder(direction, number, row[3:])
+                        ))
+
+            if not header_seen:
+                print(f"❌ No header line found in {label} log")
+                return False
+
+            entries.sort()
+            entries = [{
+                "timestamp": timestamp,
+                "source": source_tag,
+                "type": direction,
+                "details": details
+            } for _, timestamp, direction, details in entries]
+
+            # Serialize once and write in a single call rather than
+            # json.dump's many small chunked writes
+            with open(dst, 'wb') as f:
+                f.write(_dumps_indented(entries))
+
+            print(f"✅ Processed {len(entries)} {label} entries")
+            print(f"✅ Saved to: {dst}")
             return True
-            
+
         except Exception as e:
-            print(f"❌ Error processing call log: {e}")
+            print(f"❌ Error processing {label} log: {e}")
             return False
-    
+
+    def process_call_log(self):
+        """
+        Process call log CSV and convert to forensic JSON schema.
+
+        FORENSIC TRANSPARENCY:
+        This simulates limited call artifacts for debugging purposes.
+        It does NOT access protected Android databases or bypass security.
+        """
+        print("📞 Processing live debug call log...")
+
+        return self._ingest_csv(self.raw_dir / "live_debug_calllog.csv",
+                                self.processed_dir / "calls.json",
+                                "call", "CALL", _call_details)
+
     def process_sms_log(self):
         """
         Process SMS log CSV and convert to forensic JSON schema.
-        
+
         FORENSIC TRANSPARENCY:
         This simulates limited SMS artifacts for debugging purposes.
         It does NOT access protected Android databases or bypass security.
         """
         print("💬 Processing live debug SMS log...")
-        
-        sms_file = self.raw_dir / "live_debug_sms.csv"
-        output_file = self.processed_dir / "sms.json"
-        
-        if not sms_file.exists():
-            print(f"❌ SMS log file not found: {sms_file}")
-            return False
-        
-        messages = []
-        
-        try:
-            with open(sms_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-                # Find header line
-                header_line = None
-                for i, line in enumerate(lines):
-                    if line.startswith('timestamp'):
-                        header_line = i
-                        break
-                
-                if header_line is None:
-                    print("❌ No header line found in SMS log")
-                    return False
-                
-                # Parse data from lines after header
-                data_lines = lines[header_line + 1:]
-                
-                for line in data_lines:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse CSV manually (handle message content with commas)
-                    parts = line.split(',')
-                    if len(parts) >= 4:
-                        timestamp = parts[0].strip()
-                        direction = parts[1].strip().lower()
-                        number = parts[2].strip()
-                        message = ','.join(parts[3:]).strip()  # Handle commas in message
-                        
-                        # Create forensic entry
-                        sms_entry = {
-                            "timestamp": timestamp,
-                            "source": "SMS",
-                            "type": direction,
-                            "details": f"Message {('from' if direction == 'incoming' else 'to')} {number}: {message}"
-                        }
-                        
-                        messages.append(sms_entry)
-            
-            # Sort by timestamp
-            messages.sort(key=lambda x: x['timestamp'])
-            
-            # Save to JSON
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(messages, f, indent=2)
-            
-            print(f"✅ Processed {len(messages)} SMS entries")
-            print(f"✅ Saved to: {output_file}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error processing SMS log: {e}")
-            return False
+
+        return self._ingest_csv(self.raw_dir / "live_debug_sms.csv",
+                                self.processed_dir / "sms.json",
+                                "SMS", "SMS", _sms_details)
     
     def validate_pipeline_compatibility(self):
         """Validate that generated files are compatible with existing pipeline."""
@@ -207,24 +265,14 @@ class LiveDebugCommIngestion:
         
         try:
             # Validate calls file
-            if calls_file.exists():
-                with open(calls_file, 'r') as f:
-                    calls = json.load(f)
-                
-                # Check schema compatibility
-                if calls and all(key in calls[0] for key in ["timestamp", "source", "type", "details"]):
-                    validation_results["calls_valid"] = True
-                    print(f"✅ Calls file schema validated ({len(calls)} entries)")
-            
+            if calls_file.exists() and _validate_schema(calls_file):
+                validation_results["calls_valid"] = True
+                print("✅ Calls file schema validated")
+
             # Validate SMS file
-            if sms_file.exists():
-                with open(sms_file, 'r') as f:
-                    messages = json.load(f)
-                
-                # Check schema compatibility
-                if messages and all(key in messages[0] for key in ["timestamp", "source", "type", "details"]):
-                    validation_results["sms_valid"] = True
-                    print(f"✅ SMS file schema validated ({len(messages)} entries)")
+            if sms_file.exists() and _validate_schema(sms_file):
+                validation_results["sms_valid"] = True
+                print("✅ SMS file schema validated")
             
             # Overall compatibility
             validation_results["schema_compatible"] = validation_results["calls_valid"] and validation_results["sms_valid"]